@@ -5,67 +5,247 @@ Coordinates the entire upload workflow including authentication, video scanning,
 metadata loading, upload processing, and playlist management.
 """
 
-import json
+import functools
+import itertools
 import logging
+import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from src.auth.authenticator import Authenticator
 from src.config.config_parser import ConfigParser, ConfigValidationError
-from src.playlist.playlist_manager import PlaylistManager
-from src.uploader.video_uploader import VideoUploader
-from src.utils.logger import setup_logger
+from src.utils import json_utils
+from src.utils.bloom_filter import BloomFilter, PersistentBloomFilter
+from src.utils.logger import flush_logger, setup_logger
 from src.utils.rate_limiter import RateLimiter
 
+# The uploader and playlist modules import the Google API client, which is
+# slow to load; they are imported once initialization reaches them.
+if TYPE_CHECKING:
+    from src.config.config_parser import VideoMetadata
+    from src.uploader.video_uploader import VideoUploader
+
+
+@functools.lru_cache(maxsize=None)
+def _video_filename_pattern() -> "re.Pattern[str]":
+    """Compiled pattern matching filenames with a supported video extension."""
+    from src.uploader.video_uploader import VideoUploader
+
+    extensions = "|".join(
+        re.escape(ext.lstrip(".")) for ext in sorted(VideoUploader.SUPPORTED_FORMATS)
+    )
+    return re.compile(rf".+\.(?:{extensions})", re.IGNORECASE)
+
 
 class UploadHistory:
     """Manages upload history to prevent duplicate uploads."""
 
+    # Number of appended records between fsync calls on the journal
+    FSYNC_EVERY = 10
+
     def __init__(self, history_file: str):
         """
         Initialize upload history manager.
 
+        Records are stored append-only in a JSON Lines journal next to
+        ``history_file`` (same name, ``.jsonl`` suffix). An existing JSON
+        history file is migrated into the journal on first load.
+
+        Uploads that still need adding to a playlist keep the playlist title
+        in their record; a separate record is appended once the playlist
+        insert succeeds, so inserts lost to a crash can be retried.
+
+        A memory-mapped Bloom filter (``.bloom`` suffix) indexes completed
+        filenames so that most lookups never parse the journal. The journal
+        stays authoritative; the filter is rebuilt whenever it is missing or
+        out of date.
+
         Args:
             history_file: Path to upload history JSON file
         """
         self.history_file = Path(history_file)
-        self.history = self._load_history()
+        self.journal_file = self.history_file.with_suffix(".jsonl")
+        self.bloom_file = self.history_file.with_suffix(".bloom")
         self.logger = logging.getLogger("youtube_uploader.history")
+        self._writes_since_fsync = 0
+        self._history: Optional[Dict[str, Any]] = None
+        self._completed: Optional[Set[str]] = None
+        self._pending_playlists: Optional[Dict[str, Tuple[str, str]]] = None
+        self._bloom = self._open_bloom()
+
+    @property
+    def history(self) -> Dict[str, Any]:
+        """Full upload history, loaded from the journal on first access."""
+        if self._history is None:
+            self._history = self._load_history()
+        return self._history
+
+    def _journal_stamp(self) -> Tuple[int, int]:
+        """Return (size, mtime_ns) of the journal, or (0, 0) if missing."""
+        try:
+            st = os.stat(self.journal_file)
+        except FileNotFoundError:
+            return 0, 0
+        return st.st_size, st.st_mtime_ns
+
+    def _open_bloom(self) -> Union[BloomFilter, PersistentBloomFilter]:
+        """
+        Open the persistent Bloom filter, rebuilding it if stale.
+
+        Falls back to an in-memory filter if the file cannot be mapped.
+        """
+        try:
+            bloom = PersistentBloomFilter(str(self.bloom_file))
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Persistent history index unavailable: {e}")
+            bloom = BloomFilter(
+                capacity=max(10_000, 2 * len(self.history["uploads"])),
+                error_rate=1e-4,
+            )
+            bloom.update(self._iter_completed())
+            return bloom
+
+        # A missing journal may still need migrating from legacy JSON
+        stamp = self._journal_stamp()
+        if stamp == (0, 0) or bloom.stamp != stamp:
+            self.logger.debug("Rebuilding upload history index")
+            self._history = self._load_history()
+            bloom.clear()
+            bloom.update(self._iter_completed())
+            bloom.stamp = self._journal_stamp()
+
+        return bloom
 
     def _load_history(self) -> Dict[str, Any]:
-        """Load upload history from file."""
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, "r") as f:
-                    return json.load(f)
-            except Exception:
-                pass
+        """Load upload history from the journal, migrating legacy JSON if needed."""
+        uploads = []
+        try:
+            with open(self.journal_file, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        uploads.append(json_utils.loads(line))
+                    except json_utils.JSONDecodeError:
+                        # A torn final line from an interrupted write
+                        self.logger.warning("Skipping malformed history record")
+        except FileNotFoundError:
+            return self._migrate_legacy_history()
+        except OSError as e:
+            self.logger.error(f"Failed to read upload history: {e}")
+
+        last_updated = None
+        if uploads:
+            last_updated = uploads[-1].get("uploaded_at", uploads[-1].get("added_at"))
+        return {"uploads": uploads, "last_updated": last_updated}
+
+    def _migrate_legacy_history(self) -> Dict[str, Any]:
+        """Load a legacy JSON history file and write it out as the journal."""
+        try:
+            history = json_utils.loads(self.history_file.read_bytes())
+        except (OSError, ValueError):
+            history = None
+        if not isinstance(history, dict):
+            return {"uploads": [], "last_updated": None}
+
+        history.setdefault("uploads", [])
+        history.setdefault("last_updated", None)
+        self._save_history(history)
+        self.logger.info(
+            f"Migrated upload history from {self.history_file} to {self.journal_file}"
+        )
+        return history
+
+    def _save_history(self, history: Dict[str, Any]):
+        """Rewrite the journal from a full history snapshot."""
+        try:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.journal_file.with_suffix(".jsonl.tmp")
 
-        return {"uploads": [], "last_updated": None}
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                for record in history["uploads"]:
+                    f.write(json_utils.dumps(record) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
 
-    def _save_history(self):
-        """Save upload history to file."""
+            os.replace(tmp_file, self.journal_file)
+        except Exception as e:
+            self.logger.error(f"Failed to save upload history: {e}")
+
+    def _append_record(self, record: Dict[str, Any]):
+        """Append a single record to the journal."""
         try:
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            self.history["last_updated"] = datetime.now(timezone.utc).isoformat()
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.history_file, "w") as f:
-                json.dump(self.history, f, indent=2)
+            fd = os.open(
+                self.journal_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+            with os.fdopen(fd, "ab") as f:
+                f.write(json_utils.dumps(record) + b"\n")
+
+                self._writes_since_fsync += 1
+                if self._writes_since_fsync >= self.FSYNC_EVERY:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._writes_since_fsync = 0
         except Exception as e:
             self.logger.error(f"Failed to save upload history: {e}")
 
+    def _iter_completed(self) -> Iterator[str]:
+        """Yield filenames of completed uploads in history."""
+        for upload in self.history["uploads"]:
+            if upload.get("status") == "completed" and "filename" in upload:
+                yield upload["filename"]
+
+    def _completed_set(self) -> Set[str]:
+        """Return the exact set of completed filenames, building it on first use."""
+        if self._completed is None:
+            self._completed = set(self._iter_completed())
+        return self._completed
+
+    def _pending_playlist_map(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Return (video_id, playlist title) for completed uploads whose
+        playlist insert has not been recorded, keyed by filename.
+        """
+        if self._pending_playlists is None:
+            pending = {}
+            for upload in self.history["uploads"]:
+                filename = upload.get("filename")
+                status = upload.get("status")
+                if (
+                    status == "completed"
+                    and upload.get("playlist")
+                    and not upload.get("playlist_id")
+                ):
+                    pending[filename] = (upload["video_id"], upload["playlist"])
+                elif status in ("completed", "playlist_added", "playlist_abandoned"):
+                    pending.pop(filename, None)
+            self._pending_playlists = pending
+        return self._pending_playlists
+
+    def get_pending_playlist(self, filename: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the playlist insert still owed to an uploaded video.
+
+        Returns:
+            (video_id, playlist title), or None if nothing is pending
+        """
+        return self._pending_playlist_map().get(filename)
+
     def is_uploaded(self, filename: str) -> bool:
         """Check if a video has already been uploaded."""
-        for upload in self.history["uploads"]:
-            if (
-                upload.get("filename") == filename
-                and upload.get("status") == "completed"
-            ):
-                return True
-        return False
+        if filename not in self._bloom:
+            return False
+        return filename in self._completed_set()
 
     def add_upload(
         self,
@@ -74,29 +254,97 @@ class UploadHistory:
         title: str,
         playlist_id: Optional[str] = None,
         status: str = "completed",
+        playlist: Optional[str] = None,
     ):
-        """Add an upload record to history."""
+        """
+        Add an upload record to history.
+
+        Pass ``playlist`` (a title) instead of ``playlist_id`` when the
+        video has yet to be added to its playlist; record the insert with
+        add_playlist_item once it succeeds.
+        """
+        now_iso = datetime.now(timezone.utc).isoformat()
         record = {
             "filename": filename,
             "video_id": video_id,
             "title": title,
-            "uploaded_at": datetime.now(timezone.utc).isoformat(),
+            "uploaded_at": now_iso,
             "playlist_id": playlist_id,
             "status": status,
         }
-
-        self.history["uploads"].append(record)
-        self._save_history()
+        if playlist and not playlist_id:
+            record["playlist"] = playlist
+
+        if self._history is not None:
+            self._history["uploads"].append(record)
+            self._history["last_updated"] = now_iso
+        if status == "completed":
+            self._bloom.add(filename)
+            if self._completed is not None:
+                self._completed.add(filename)
+            if self._pending_playlists is not None:
+                if "playlist" in record:
+                    self._pending_playlists[filename] = (video_id, playlist)
+                else:
+                    self._pending_playlists.pop(filename, None)
+        self._append_record(record)
+        if isinstance(self._bloom, PersistentBloomFilter):
+            self._bloom.stamp = self._journal_stamp()
         self.logger.info(f"Added upload record for {filename}")
 
+    def add_playlist_item(
+        self,
+        filename: str,
+        video_id: str,
+        playlist_id: Optional[str],
+        status: str = "playlist_added",
+    ):
+        """
+        Record the outcome of an uploaded video's playlist insert.
+
+        Use status "playlist_abandoned" for inserts that cannot succeed,
+        so later runs stop retrying them.
+        """
+        now_iso = datetime.now(timezone.utc).isoformat()
+        record = {
+            "filename": filename,
+            "video_id": video_id,
+            "playlist_id": playlist_id,
+            "added_at": now_iso,
+            "status": status,
+        }
+
+        if self._history is not None:
+            self._history["uploads"].append(record)
+            self._history["last_updated"] = now_iso
+        if self._pending_playlists is not None:
+            self._pending_playlists.pop(filename, None)
+        self._append_record(record)
+        if isinstance(self._bloom, PersistentBloomFilter):
+            self._bloom.stamp = self._journal_stamp()
+
     def get_uploaded_count(self) -> int:
         """Get count of successfully uploaded videos."""
-        return sum(1 for u in self.history["uploads"] if u.get("status") == "completed")
+        return len(self._completed_set())
+
+    def close(self):
+        """Flush and release the persistent history index. Do not use after."""
+        if isinstance(self._bloom, PersistentBloomFilter):
+            self._bloom.close()
 
 
 class YouTubeUploader:
     """Main orchestrator for YouTube upload workflow."""
 
+    # Rate limiter tokens acquired at a time for upload/playlist requests
+    TOKEN_BATCH_SIZE = 10
+
+    # Queued playlist inserts sent together while uploads are running
+    PLAYLIST_BATCH_SIZE = 10
+
+    # Playlist insert errors that retrying in a later run will not fix
+    PERMANENT_PLAYLIST_ERRORS = frozenset({403, 404})
+
     def __init__(self, config_path: str = "./config/config.json"):
         """
         Initialize YouTube uploader.
@@ -114,6 +362,17 @@ class YouTubeUploader:
         self.upload_history = None
         self.config_path = config_path
 
+        # Guard shared upload state and playlist lookups across workers
+        self._state_lock = threading.Lock()
+        self._playlist_lock = threading.Lock()
+
+        # Request tokens taken from the rate limiter but not yet used
+        self._token_lock = threading.Lock()
+        self._tokens_available = 0
+
+        # (filename, video_id, playlist_id, playlist title) awaiting insert
+        self._pending_playlist_items: List[Tuple[str, str, str, str]] = []
+
     def initialize_system(self) -> bool:
         """
         Initialize all system components.
@@ -147,6 +406,7 @@ class YouTubeUploader:
                 log_dir=self.config.logging.log_directory,
                 max_bytes=self.config.logging.max_log_size_mb * 1024 * 1024,
                 backup_count=self.config.logging.backup_count,
+                backend=self.config.logging.log_backend,
             )
 
             self.logger.info("=" * 60)
@@ -202,6 +462,9 @@ class YouTubeUploader:
                     )
                 self.logger.info(f"Authenticated as: {user_info['title']}")
 
+            from src.playlist.playlist_manager import PlaylistManager
+            from src.uploader.video_uploader import VideoUploader
+
             # Initialize uploader
             self.logger.info("Initializing video uploader...")
             self.uploader = VideoUploader(
@@ -239,12 +502,25 @@ class YouTubeUploader:
                 print(f"System initialization failed: {e}")
             return False
 
-    def scan_videos(self) -> List[Path]:
+    @staticmethod
+    def _iter_video_entries(entries: Iterator[os.DirEntry]) -> Iterator[os.DirEntry]:
+        """Yield directory entries that are video files with a supported extension."""
+        match = _video_filename_pattern().fullmatch
+        for entry in entries:
+            if match(entry.name) and entry.is_file():
+                yield entry
+
+    def _flush_log_buffers(self):
+        """Flush any queued log records to their files."""
+        if self.logger:
+            flush_logger(self.logger.name)
+
+    def scan_videos(self) -> List[str]:
         """
         Scan videos directory and return sorted list of video files.
 
         Returns:
-            List of video file paths, sorted alphabetically
+            List of video file paths (as strings), sorted alphabetically
         """
         videos_dir = Path(self.config.paths.videos_directory)
 
@@ -252,17 +528,17 @@ class YouTubeUploader:
             self.logger.warning(f"Videos directory does not exist: {videos_dir}")
             return []
 
-        # Get all video files
-        video_files = []
-        for ext in VideoUploader.SUPPORTED_FORMATS:
-            video_files.extend(videos_dir.glob(f"*{ext}"))
-
-        # Sort alphabetically
-        video_files.sort(key=lambda p: p.name.lower())
+        # Get all video files in a single directory pass, sorted alphabetically
+        with os.scandir(videos_dir) as it:
+            decorated = sorted(
+                (entry.name.lower(), entry.path)
+                for entry in self._iter_video_entries(it)
+            )
+        video_files = [path for _, path in decorated]
 
         self.logger.info(f"Found {len(video_files)} video files in {videos_dir}")
         for video in video_files:
-            self.logger.debug(f"  - {video.name}")
+            self.logger.debug(f"  - {os.path.basename(video)}")
 
         return video_files
 
@@ -278,7 +554,7 @@ class YouTubeUploader:
             "successful": 0,
             "failed": 0,
             "skipped": 0,
-            "start_time": datetime.now(),
+            "start_time": time.perf_counter(),
             "videos": [],
         }
 
@@ -294,20 +570,7 @@ class YouTubeUploader:
         try:
             self.config_parser.load_video_metadata(str(metadata_file))
         except ConfigValidationError as cve:
-            # Full traceback already logged by the parser; present friendly message to console
-            try:
-                from rich.console import Console
-                from rich.panel import Panel
-
-                Console().print(Panel(cve.args[0], title="ERROR", style="bold red"))
-            except Exception:
-                print(cve.args[0])
-            # Log a short guidance message to the file logger
-            if self.logger:
-                self.logger.error(
-                    "Configuration validation failed. See log file for details."
-                )
-            sys.exit(2)
+            self._exit_on_metadata_error(cve)
         except Exception as exc:
             # Unexpected error while loading metadata — log full traceback to file only
             if self.logger:
@@ -333,101 +596,347 @@ class YouTubeUploader:
             self.logger.warning("No videos found to upload")
             return stats
 
-        # Process each video
-        for index, video_path in enumerate(video_files, 1):
-            filename = video_path.name
+        # Filter out videos already in history in one pass
+        pending = []
+        uploaded = []
+        for path, name in zip(video_files, map(os.path.basename, video_files)):
+            if self.upload_history.is_uploaded(name):
+                uploaded.append(name)
+            else:
+                pending.append((path, name))
+        stats["skipped"] = len(uploaded)
+        if stats["skipped"]:
+            self.logger.info(f"Skipping {stats['skipped']} video(s) already uploaded")
+
+        # Playlist inserts a previous run uploaded but never recorded
+        retries = []
+        for name in uploaded:
+            owed = self.upload_history.get_pending_playlist(name)
+            if owed:
+                retries.append((name, *owed))
+
+        # Video entries are validated on first lookup
+        try:
+            metas = [self.config_parser.get_video_metadata(name) for _, name in pending]
+        except ConfigValidationError as cve:
+            self._exit_on_metadata_error(cve)
 
-            self.logger.info(f"\n[{index}/{len(video_files)}] Processing: {filename}")
+        # Fail fast on quota: keep the longest prefix of the batch that fits
+        operations_needed = {
+            "video_upload": len(pending),
+            "playlist_insert": len(retries) + sum(1 for m in metas if m.playlist),
+        }
+        if not self.rate_limiter.can_perform_operations(operations_needed):
+            fits, retry_fits = self._fit_to_quota(metas, len(retries))
+            retries = retries[:retry_fits]
 
-            # Check if already uploaded
-            if self.upload_history.is_uploaded(filename):
-                self.logger.info(f"Video already uploaded, skipping: {filename}")
-                stats["skipped"] += 1
-                continue
+            if fits == 0:
+                self.logger.error("Insufficient quota, stopping uploads")
+            else:
+                self.logger.error(
+                    f"Insufficient quota for all {len(pending)} pending videos, "
+                    f"uploading the first {fits}"
+                )
+            pending = pending[:fits]
+            metas = metas[:fits]
 
-            # Get metadata
-            metadata = self.config_parser.get_video_metadata(filename)
+        # Process videos on a bounded pool; with one worker this is sequential
+        max_workers = self.config.upload.concurrent_uploads
+        self._pending_playlist_items = []
 
-            # Check quota before upload
-            if not self.rate_limiter.check_quota("video_upload"):
-                self.logger.error("Insufficient quota, stopping uploads")
+        try:
+            if retries:
+                self.logger.info(
+                    f"Retrying playlist inserts for {len(retries)} uploaded video(s)"
+                )
+            for filename, video_id, playlist_title in retries:
+                self._queue_playlist_item(filename, video_id, playlist_title)
+
+            self._run_upload_pool(pending, metas, stats, max_workers)
+        finally:
+            # Send whatever is still queued; failures are retried next run
+            with self._playlist_lock:
+                self._add_pending_to_playlists()
+            self.rate_limiter.flush()
+
+        stats["end_time"] = time.perf_counter()
+        stats["duration"] = stats["end_time"] - stats["start_time"]
+
+        return stats
+
+    def _fit_to_quota(
+        self, metas: List["VideoMetadata"], owed_inserts: int
+    ) -> Tuple[int, int]:
+        """
+        Work out how much of a batch fits in the remaining daily quota.
+
+        Owed playlist inserts from earlier runs are served first; then the
+        longest prefix of the pending videos whose uploads and playlist
+        inserts still fit is kept.
+
+        Args:
+            metas: Metadata of the pending videos, in upload order
+            owed_inserts: Number of owed playlist inserts
+
+        Returns:
+            (number of pending videos, number of owed inserts) that fit
+        """
+        upload_cost = self.rate_limiter.estimate_operation_cost("video_upload")
+        playlist_cost = self.rate_limiter.estimate_operation_cost("playlist_insert")
+        budget = self.rate_limiter.get_quota_status()["remaining"]
+
+        # The owed inserts that do not fit wait for a later run
+        if playlist_cost:
+            owed_inserts = min(owed_inserts, max(0, budget // playlist_cost))
+        budget -= playlist_cost * owed_inserts
+
+        fits = 0
+        for metadata in metas:
+            cost = upload_cost + (playlist_cost if metadata.playlist else 0)
+            if cost > budget:
                 break
+            budget -= cost
+            fits += 1
+        return fits, owed_inserts
 
-            # Check quota for playlist operations if needed
-            if metadata.playlist:
-                operations_needed = {"video_upload": 1, "playlist_insert": 1}
-                if not self.rate_limiter.can_perform_operations(operations_needed):
-                    self.logger.error(
-                        "Insufficient quota for upload + playlist, stopping"
+    def _run_upload_pool(
+        self,
+        pending: List[Tuple[str, str]],
+        metas: List["VideoMetadata"],
+        stats: Dict[str, Any],
+        max_workers: int,
+    ):
+        """
+        Upload the pending videos on a bounded pool of worker threads.
+
+        At most max_workers uploads are submitted at a time, so an
+        interrupt only waits for the uploads already running.
+        """
+        jobs = enumerate(zip(pending, metas), 1)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="upload"
+        ) as executor:
+            futures: Dict[Future, str] = {}
+            while True:
+                for index, ((video_path, filename), metadata) in itertools.islice(
+                    jobs, max_workers - len(futures)
+                ):
+                    future = executor.submit(
+                        self._upload_single_video,
+                        index,
+                        len(pending),
+                        video_path,
+                        filename,
+                        metadata,
+                        stats,
+                        max_workers > 1,
                     )
+                    futures[future] = filename
+                if not futures:
                     break
 
-            # Wait for rate limit
-            self.rate_limiter.wait_for_token()
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    filename = futures.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.error(
+                            f"✗ Upload failed: {filename}: {e}", exc_info=True
+                        )
+                        with self._state_lock:
+                            stats["failed"] += 1
+                            stats["videos"].append(
+                                {"filename": filename, "status": "failed"}
+                            )
 
-            # Upload video
-            self.logger.info(f"Title: {metadata.title}")
-            self.logger.info(f"Privacy: {metadata.privacy_status}")
-            if metadata.playlist:
-                self.logger.info(f"Playlist: {metadata.playlist}")
+    def _queue_playlist_item(self, filename: str, video_id: str, playlist_title: str):
+        """
+        Queue an uploaded video for its playlist, sending a batch once full.
 
-            video_id = self.uploader.upload_video(
-                video_path=str(video_path), metadata=metadata
+        Playlist requests share the main API service, so they run under
+        the playlist lock.
+        """
+        with self._playlist_lock:
+            playlist_id = self.playlist_manager.get_or_create_playlist(
+                title=playlist_title,
+                description=f"Playlist for {playlist_title}",
+                privacy_status=self.config.playlist.default_playlist_privacy,
+                create_if_not_exists=self.config.playlist.create_if_not_exists,
             )
-
-            if video_id:
-                # Consume quota
-                self.rate_limiter.consume_quota("video_upload", metadata.title)
-
-                # Handle playlist
-                playlist_id = None
-                if metadata.playlist:
-                    playlist_id = self.playlist_manager.get_or_create_playlist(
-                        title=metadata.playlist,
-                        description=f"Playlist for {metadata.playlist}",
-                        privacy_status=self.config.playlist.default_playlist_privacy,
-                        create_if_not_exists=self.config.playlist.create_if_not_exists,
+            if not playlist_id:
+                self.logger.warning(
+                    f"Playlist unavailable, not adding {filename}: {playlist_title}"
+                )
+                with self._state_lock:
+                    self.upload_history.add_playlist_item(
+                        filename, video_id, None, status="playlist_abandoned"
                     )
+                return
+
+            self._pending_playlist_items.append(
+                (filename, video_id, playlist_id, playlist_title)
+            )
+            if len(self._pending_playlist_items) >= self.PLAYLIST_BATCH_SIZE:
+                self._add_pending_to_playlists()
 
-                    if playlist_id:
-                        self.rate_limiter.wait_for_token()
+    def _add_pending_to_playlists(self):
+        """
+        Add queued videos to their playlists using batched requests.
 
-                        if self.playlist_manager.add_video_to_playlist(
-                            video_id, playlist_id
-                        ):
-                            self.rate_limiter.consume_quota(
-                                "playlist_insert", metadata.playlist
-                            )
-                            self.logger.info(f"Added to playlist: {metadata.playlist}")
-                        else:
-                            self.logger.warning(
-                                f"Failed to add video to playlist: {metadata.playlist}"
-                            )
+        Callers hold the playlist lock. Successful inserts, and inserts the
+        API rejects permanently, are recorded in history; other failures
+        are retried on the next run. The order of videos within a playlist
+        is not guaranteed.
+        """
+        pending, self._pending_playlist_items = self._pending_playlist_items, []
+        if not pending:
+            return
 
-                # Record in history
-                self.upload_history.add_upload(
-                    filename=filename,
-                    video_id=video_id,
-                    title=metadata.title,
-                    playlist_id=playlist_id,
-                    status="completed",
+        for _ in pending:
+            self._take_request_token()
+
+        errors: Dict[int, int] = {}
+        results = self.playlist_manager.add_videos_to_playlist(
+            [(video_id, playlist_id) for _, video_id, playlist_id, _ in pending],
+            errors=errors,
+        )
+        for index, (filename, video_id, playlist_id, playlist_title) in enumerate(
+            pending
+        ):
+            if results[index]:
+                self.rate_limiter.consume_quota("playlist_insert", playlist_title)
+                with self._state_lock:
+                    self.upload_history.add_playlist_item(
+                        filename, video_id, playlist_id
+                    )
+                self.logger.info(f"Added {video_id} to playlist: {playlist_title}")
+            elif errors.get(index) in self.PERMANENT_PLAYLIST_ERRORS:
+                self.logger.warning(
+                    f"Giving up adding video {video_id} to playlist: "
+                    f"{playlist_title} (HTTP {errors[index]})"
                 )
+                with self._state_lock:
+                    self.upload_history.add_playlist_item(
+                        filename, video_id, playlist_id, status="playlist_abandoned"
+                    )
+            else:
+                self.logger.warning(
+                    f"Failed to add video {video_id} to playlist: {playlist_title}"
+                )
+
+    def _exit_on_metadata_error(self, cve: ConfigValidationError):
+        """Report invalid video metadata and exit with status 2."""
+        # Full traceback already logged by the parser; present friendly message to console
+        try:
+            from rich.console import Console
+            from rich.panel import Panel
+
+            Console().print(Panel(cve.args[0], title="ERROR", style="bold red"))
+        except Exception:
+            print(cve.args[0])
+        # Log a short guidance message to the file logger
+        if self.logger:
+            self.logger.error(
+                "Configuration validation failed. See log file for details."
+            )
+        sys.exit(2)
 
-                stats["successful"] += 1
-                stats["videos"].append(
-                    {"filename": filename, "video_id": video_id, "status": "success"}
+    def _get_worker_uploader(self) -> "VideoUploader":
+        """
+        Return the video uploader for the current worker thread.
+
+        The underlying HTTP transport is not thread-safe, so when uploads
+        run concurrently each worker thread gets its own API service object.
+        """
+        service_factory = None
+        if self.config.upload.concurrent_uploads > 1:
+            service_factory = self.authenticator.build_service
+        return self.uploader.for_current_thread(service_factory)
+
+    def _take_request_token(self):
+        """Take one request token, refilling from the rate limiter in batches."""
+        with self._token_lock:
+            if self._tokens_available == 0:
+                self._tokens_available = self.rate_limiter.acquire_batch(
+                    self.TOKEN_BATCH_SIZE
                 )
+            self._tokens_available -= 1
 
-                self.logger.info(f"✓ Upload completed: {video_id}")
-            else:
+    def _upload_single_video(
+        self,
+        index: int,
+        total: int,
+        video_path: str,
+        filename: str,
+        metadata: "VideoMetadata",
+        stats: Dict[str, Any],
+        quiet_progress: bool = False,
+    ):
+        """
+        Upload a single video, record it, and queue it for its playlist.
+
+        Runs on an upload worker thread. Quota for the whole batch has
+        already been checked by process_uploads.
+
+        Args:
+            index: 1-based position of the video in the batch
+            total: Number of videos in the batch
+            video_path: Path to the video file
+            filename: Base name of the video file
+            metadata: VideoMetadata for the video
+            stats: Shared statistics dictionary (guarded by the state lock)
+            quiet_progress: Suppress the interactive progress display
+        """
+        self.logger.info(f"\n[{index}/{total}] Processing: {filename}")
+
+        # Wait for rate limit
+        self._take_request_token()
+
+        # Upload video
+        self.logger.info(f"Title: {metadata.title}")
+        self.logger.info(f"Privacy: {metadata.privacy_status}")
+        if metadata.playlist:
+            self.logger.info(f"Playlist: {metadata.playlist}")
+
+        # Concurrent Rich live displays conflict, so workers report quietly
+        uploader = self._get_worker_uploader()
+        video_id = uploader.upload_video(
+            video_path=video_path,
+            metadata=metadata,
+            progress_callback=uploader.discard_progress if quiet_progress else None,
+        )
+
+        if not video_id:
+            with self._state_lock:
                 stats["failed"] += 1
                 stats["videos"].append({"filename": filename, "status": "failed"})
-                self.logger.error(f"✗ Upload failed: {filename}")
+            self.logger.error(f"✗ Upload failed: {filename}")
+            return
+
+        # Consume quota
+        self.rate_limiter.consume_quota("video_upload", metadata.title)
+
+        # Record in history; the playlist insert is recorded once it succeeds
+        with self._state_lock:
+            self.upload_history.add_upload(
+                filename=filename,
+                video_id=video_id,
+                title=metadata.title,
+                status="completed",
+                playlist=metadata.playlist,
+            )
 
-        stats["end_time"] = datetime.now()
-        stats["duration"] = (stats["end_time"] - stats["start_time"]).total_seconds()
+            stats["successful"] += 1
+            stats["videos"].append(
+                {"filename": filename, "video_id": video_id, "status": "success"}
+            )
 
-        return stats
+        self.logger.info(f"✓ Upload completed: {video_id}")
+
+        # Handle playlist
+        if metadata.playlist:
+            self._queue_playlist_item(filename, video_id, metadata.playlist)
 
     def print_summary(self, stats: Dict[str, Any]):
         """Print upload summary."""
@@ -461,10 +970,12 @@ class YouTubeUploader:
         if self.logger:
             self.logger.info("Cleaning up resources...")
 
-        # No explicit cleanup needed for current implementation
+        if self.upload_history:
+            self.upload_history.close()
 
         if self.logger:
             self.logger.info("Cleanup completed")
+        self._flush_log_buffers()
 
     def run(self) -> int:
         """
@@ -502,6 +1013,9 @@ class YouTubeUploader:
             print(f"Unexpected error: {e}")
             return 1
 
+        finally:
+            self._flush_log_buffers()
+
 
 def main():
     """Main entry point."""
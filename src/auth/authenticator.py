@@ -6,14 +6,18 @@ Manages authentication flow, token storage, and refresh.
 
 import logging
 import os
+import tempfile
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from ..utils import json_utils
+
+# Google client libraries are imported lazily inside the methods that need
+# them; importing them pulls in httplib2/protobuf and dominates startup.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 
 class Authenticator:
@@ -34,6 +38,12 @@ class Authenticator:
     API_SERVICE_NAME = "youtube"
     API_VERSION = "v3"
 
+    # Re-validate credentials this long before they expire
+    SERVICE_EXPIRY_MARGIN_SECONDS = 60
+
+    # Re-validate credentials without an expiry this often
+    SERVICE_NO_EXPIRY_TTL_SECONDS = 300
+
     def __init__(
         self, client_secrets_file: str, credentials_file: Optional[str] = None
     ):
@@ -61,8 +71,12 @@ class Authenticator:
                 pass  # Windows doesn't support chmod
 
         self.logger = logging.getLogger("youtube_uploader.authenticator")
-        self.credentials: Optional[Credentials] = None
+        self.credentials: Optional["Credentials"] = None
         self.service = None
+        self._service_valid_until = 0.0
+
+        # Last credentials JSON written to disk, to skip redundant saves
+        self._last_creds_json: Optional[str] = None
 
     def authenticate(self) -> bool:
         """
@@ -74,13 +88,19 @@ class Authenticator:
         Returns:
             True if authentication successful, False otherwise
         """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         try:
             # Load existing credentials
-            if self.credentials_file.exists():
-                self.logger.info("Loading existing credentials")
+            try:
                 self.credentials = Credentials.from_authorized_user_file(
                     str(self.credentials_file), self.SCOPES
                 )
+                self.logger.info("Loaded existing credentials")
+            except FileNotFoundError:
+                pass
 
             # Refresh or obtain new credentials
             if not self.credentials or not self.credentials.valid:
@@ -132,17 +152,34 @@ class Authenticator:
             return False
 
     def _save_credentials(self):
-        """Save credentials to file."""
+        """Save credentials to file, skipping the write if nothing changed."""
         try:
-            with open(self.credentials_file, "w") as f:
-                f.write(self.credentials.to_json())
+            creds_json = self.credentials.to_json()
+            if creds_json == self._last_creds_json:
+                self.logger.debug("Credentials unchanged, skipping save")
+                return
+
+            # Write to a temporary file in the same directory and atomically
+            # swap it in so a partial write never corrupts stored credentials.
+            # The temporary file is created with mode 0o600, so there is no
+            # window where the token is readable by other users.
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=self.credentials_file.parent,
+                prefix=f".{self.credentials_file.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = f.name
+                f.write(creds_json)
 
-            # Set restrictive permissions
             try:
-                os.chmod(self.credentials_file, 0o600)
+                os.replace(tmp_path, self.credentials_file)
             except Exception:
-                pass  # Windows doesn't support chmod
+                os.unlink(tmp_path)
+                raise
 
+            self._last_creds_json = creds_json
             self.logger.debug(f"Credentials saved to {self.credentials_file}")
         except Exception as e:
             self.logger.error(f"Failed to save credentials: {e}")
@@ -154,6 +191,10 @@ class Authenticator:
         Returns:
             YouTube API service object or None if authentication failed
         """
+        # Fast path: cached service whose credentials are known to be fresh
+        if self.service is not None and time.monotonic() < self._service_valid_until:
+            return self.service
+
         if not self.credentials or not self.credentials.valid:
             self.logger.warning("Credentials invalid, attempting re-authentication")
             if not self.authenticate():
@@ -161,18 +202,50 @@ class Authenticator:
 
         if not self.service:
             try:
-                self.service = build(
-                    self.API_SERVICE_NAME,
-                    self.API_VERSION,
-                    credentials=self.credentials,
-                )
+                self.service = self.build_service()
                 self.logger.info("YouTube API service initialized")
             except Exception as e:
                 self.logger.error(f"Failed to build API service: {e}")
                 return None
 
+        self._service_valid_until = self._credentials_valid_until()
         return self.service
 
+    def _credentials_valid_until(self) -> float:
+        """
+        Return the monotonic time until which credentials can be trusted.
+
+        Leaves a safety margin before the token expiry; credentials without
+        an expiry are re-checked every SERVICE_NO_EXPIRY_TTL_SECONDS.
+        """
+        expiry = getattr(self.credentials, "expiry", None)
+        if expiry is None:
+            return time.monotonic() + self.SERVICE_NO_EXPIRY_TTL_SECONDS
+
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        remaining = (expiry - now).total_seconds()
+        return time.monotonic() + remaining - self.SERVICE_EXPIRY_MARGIN_SECONDS
+
+    def build_service(self):
+        """
+        Build a new YouTube API service object from current credentials.
+
+        Service objects share an HTTP transport that is not thread-safe;
+        use this to give each worker thread its own instance.
+
+        Returns:
+            YouTube API service object
+        """
+        from googleapiclient.discovery import build
+
+        return build(
+            self.API_SERVICE_NAME,
+            self.API_VERSION,
+            credentials=self.credentials,
+            model=json_utils.api_model(),
+        )
+
     def refresh_credentials(self) -> bool:
         """
         Manually refresh credentials.
@@ -180,6 +253,8 @@ class Authenticator:
         Returns:
             True if refresh successful, False otherwise
         """
+        from google.auth.transport.requests import Request
+
         try:
             if not self.credentials:
                 self.logger.error("No credentials to refresh")
@@ -195,6 +270,7 @@ class Authenticator:
 
             # Invalidate service to force rebuild with new credentials
             self.service = None
+            self._service_valid_until = 0.0
 
             return True
         except Exception as e:
@@ -227,6 +303,7 @@ class Authenticator:
 
             self.credentials = None
             self.service = None
+            self._service_valid_until = 0.0
 
             return True
         except Exception as e:
@@ -249,6 +326,8 @@ class Authenticator:
         Returns:
             Dictionary with user info or None if unavailable
         """
+        from googleapiclient.errors import HttpError
+
         try:
             service = self.get_authenticated_service()
             if not service:
@@ -1,5 +1,19 @@
 """Configuration module"""
 
-from .config_parser import AppConfig, ConfigParser, VideoMetadata
+from typing import TYPE_CHECKING, Any
+
+from .config_parser import ConfigParser
+
+if TYPE_CHECKING:
+    from ._models import AppConfig, VideoMetadata
 
 __all__ = ["ConfigParser", "VideoMetadata", "AppConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve model names lazily so importing the package stays cheap."""
+    if name in ("AppConfig", "VideoMetadata"):
+        from . import config_parser
+
+        return getattr(config_parser, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,245 @@
+"""
+Pydantic models for the configuration files.
+
+Kept separate from the parser so the schemas are only built when a
+config is actually loaded.
+"""
+
+import dataclasses
+import sys
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field
+from typing_extensions import Annotated  # typing.Annotated needs Python 3.9
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Plain sub-configs without custom validators are slotted dataclasses;
+# dataclass(slots=True) needs Python 3.10, older versions omit the slots
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+DEFAULT_DESCRIPTION_TEMPLATE = "Uploaded on {date}"
+
+
+def _lower(value: Any) -> Any:
+    """Lower-case string input before Literal validation."""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _upper(value: Any) -> Any:
+    """Upper-case string input before Literal validation."""
+    return value.upper() if isinstance(value, str) else value
+
+
+# Case-insensitive enumerations, validated natively by pydantic-core
+PrivacyStatus = Annotated[
+    Literal["private", "public", "unlisted"], BeforeValidator(_lower)
+]
+LogLevel = Annotated[
+    Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], BeforeValidator(_upper)
+]
+
+
+def _validate_tags_length(tags: List[str]) -> List[str]:
+    """Validate tags total length."""
+    if sum(map(len, tags)) > 500:
+        raise ValueError("Total tags length cannot exceed 500 characters")
+    return tags
+
+
+Tags = Annotated[List[str], AfterValidator(_validate_tags_length)]
+
+
+def _validate_chunk_size(chunk_size_mb: int) -> int:
+    """Validate upload chunk size; -1 uploads the file in one request."""
+    if chunk_size_mb == 0 or chunk_size_mb < -1:
+        raise ValueError("Chunk size must be positive, or -1 for a single request")
+    return chunk_size_mb
+
+
+ChunkSizeMB = Annotated[int, AfterValidator(_validate_chunk_size)]
+
+
+def _construct_model(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Recursively build a model from trusted data without validation.
+
+    model_construct() does not recurse, so nested BaseModel fields (and
+    lists of them) are constructed here before the outer model.
+    """
+    values = dict(data)
+    for name, field in model_cls.model_fields.items():
+        value = values.get(name)
+        if value is None:
+            continue
+
+        annotation = field.annotation
+        if get_origin(annotation) in (list, List):
+            (item_cls,) = get_args(annotation) or (None,)
+            if isinstance(item_cls, type) and issubclass(item_cls, BaseModel):
+                values[name] = [_construct_model(item_cls, item) for item in value]
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            values[name] = _construct_model(annotation, value)
+        elif dataclasses.is_dataclass(annotation) and isinstance(value, dict):
+            values[name] = annotation(**value)
+
+    return model_cls.model_construct(**values)
+
+
+class VideoMetadata(BaseModel):
+    """Video metadata model with validation."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    filename: str = Field(..., description="Video filename")
+    title: str = Field(..., min_length=1, max_length=100, description="Video title")
+    description: str = Field(
+        default="", max_length=5000, description="Video description"
+    )
+    tags: Tags = Field(default_factory=list, description="Video tags")
+    category_id: str = Field(default="22", description="YouTube category ID")
+    privacy_status: PrivacyStatus = Field(
+        default="private", description="Privacy status"
+    )
+    playlist: Optional[str] = Field(default=None, description="Playlist title")
+    language: str = Field(default="en", description="Video language ISO code")
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class PathConfig:
+    """Path configuration model."""
+
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
+    videos_directory: Annotated[
+        str, Field(description="Videos directory path")
+    ] = "./videos"
+    credentials_file: Annotated[
+        str, Field(description="OAuth credentials file")
+    ] = "./config/client_secrets.json"
+    upload_history: Annotated[
+        str, Field(description="Upload history file")
+    ] = "./data/upload_history.json"
+
+
+class UploadConfig(BaseModel):
+    """Upload configuration model."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    default_privacy: PrivacyStatus = Field(
+        default="private", description="Default privacy status"
+    )
+    chunk_size_mb: ChunkSizeMB = Field(
+        default=100, le=100, description="Upload chunk size in MB, -1 for one request"
+    )
+    max_retries: int = Field(
+        default=5, ge=1, le=10, description="Maximum retry attempts"
+    )
+    retry_delay_seconds: int = Field(
+        default=2, ge=1, le=60, description="Base retry delay"
+    )
+    concurrent_uploads: int = Field(
+        default=1, ge=1, le=5, description="Concurrent uploads"
+    )
+
+
+class PlaylistConfig(BaseModel):
+    """Playlist configuration model."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    create_if_not_exists: bool = Field(
+        default=True, description="Create playlist if doesn't exist"
+    )
+    default_playlist_privacy: PrivacyStatus = Field(
+        default="private", description="Default playlist privacy"
+    )
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class APIConfig:
+    """API configuration model."""
+
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
+    quota_limit_per_day: Annotated[
+        int, Field(ge=1, description="Daily quota limit")
+    ] = 10000
+    max_requests_per_minute: Annotated[
+        int, Field(ge=1, le=100, description="Max requests per minute")
+    ] = 60
+
+
+class LoggingConfig(BaseModel):
+    """Logging configuration model."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    level: LogLevel = Field(default="INFO", description="Logging level")
+    log_directory: str = Field(default="./logs", description="Log directory path")
+    max_log_size_mb: int = Field(
+        default=50, ge=1, le=1000, description="Max log file size in MB"
+    )
+    backup_count: int = Field(
+        default=5, ge=1, le=100, description="Number of backup logs"
+    )
+    log_backend: Annotated[
+        Literal["file", "watched", "syslog"], BeforeValidator(_lower)
+    ] = Field(default="file", description="Log destination")
+
+
+class AppConfig(BaseModel):
+    """Main application configuration model."""
+
+    model_config = ConfigDict(extra="allow")
+
+    paths: PathConfig = Field(default_factory=PathConfig)
+    upload: UploadConfig = Field(default_factory=UploadConfig)
+    playlist: PlaylistConfig = Field(default_factory=PlaylistConfig)
+    api: APIConfig = Field(default_factory=APIConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+
+
+class DefaultMetadata(BaseModel):
+    """Default metadata model."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    category_id: str = Field(default="22")
+    privacy_status: str = Field(default="private")
+    tags: List[str] = Field(default_factory=list)
+    language: str = Field(default="en")
+    playlist: Optional[str] = Field(default=None)
+
+
+class FallbackConfig(BaseModel):
+    """Fallback configuration for missing metadata."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    title_template: str = Field(default="{filename}")
+    description_template: str = Field(default=DEFAULT_DESCRIPTION_TEMPLATE)
+    use_filename_as_title: bool = Field(default=True)
+
+
+class VideoMetadataConfig(BaseModel):
+    """Video metadata configuration container."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    default_metadata: DefaultMetadata = Field(default_factory=DefaultMetadata)
+    # Raw entries; each is validated as VideoMetadata when first looked up
+    videos: List[Dict[str, Any]] = Field(default_factory=list)
+    fallback: FallbackConfig = Field(default_factory=FallbackConfig)
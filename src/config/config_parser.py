@@ -4,214 +4,86 @@ Configuration parser with Pydantic validation.
 Handles loading and validating JSON configuration files for the YouTube uploader.
 """
 
-import json
+import functools
+import hashlib
 import logging
+import os
+import pickle
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from ..utils import json_utils
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel, ValidationError
 
-class ConfigValidationError(Exception):
-    """Raised when configuration validation fails for metadata loading."""
-
-    def __init__(self, message: str):
-        """
-        Store a concise, user-facing message describing validation problems.
-        The full traceback is logged to file by the caller using logger.exception(...)
-        or logger.error(..., exc_info=True).
-        """
-        super().__init__(message)
-        self.message = message
-
-    def __str__(self) -> str:
-        return self.message
-
-
-class VideoMetadata(BaseModel):
-    """Video metadata model with validation."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    filename: str = Field(..., description="Video filename")
-    title: str = Field(..., min_length=1, max_length=100, description="Video title")
-    description: str = Field(
-        default="", max_length=5000, description="Video description"
-    )
-    tags: List[str] = Field(default_factory=list, description="Video tags")
-    category_id: str = Field(default="22", description="YouTube category ID")
-    privacy_status: str = Field(default="private", description="Privacy status")
-    playlist: Optional[str] = Field(default=None, description="Playlist title")
-    language: str = Field(default="en", description="Video language ISO code")
-
-    @field_validator("privacy_status")
-    @classmethod
-    def validate_privacy(cls, v: str) -> str:
-        """Validate privacy status."""
-        allowed = ["private", "public", "unlisted"]
-        if v.lower() not in allowed:
-            raise ValueError(f"Privacy status must be one of {allowed}")
-        return v.lower()
-
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: List[str]) -> List[str]:
-        """Validate tags total length."""
-        total_length = sum(len(tag) for tag in v)
-        if total_length > 500:
-            raise ValueError("Total tags length cannot exceed 500 characters")
-        return v
-
-
-class PathConfig(BaseModel):
-    """Path configuration model."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    videos_directory: str = Field(
-        default="./videos", description="Videos directory path"
-    )
-    credentials_file: str = Field(
-        default="./config/client_secrets.json", description="OAuth credentials file"
-    )
-    upload_history: str = Field(
-        default="./data/upload_history.json", description="Upload history file"
-    )
-
-
-class UploadConfig(BaseModel):
-    """Upload configuration model."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    default_privacy: str = Field(
-        default="private", description="Default privacy status"
-    )
-    chunk_size_mb: int = Field(
-        default=10, ge=1, le=100, description="Upload chunk size in MB"
-    )
-    max_retries: int = Field(
-        default=5, ge=1, le=10, description="Maximum retry attempts"
-    )
-    retry_delay_seconds: int = Field(
-        default=2, ge=1, le=60, description="Base retry delay"
-    )
-    concurrent_uploads: int = Field(
-        default=1, ge=1, le=5, description="Concurrent uploads"
-    )
-
-    @field_validator("default_privacy")
-    @classmethod
-    def validate_privacy(cls, v: str) -> str:
-        """Validate privacy status."""
-        allowed = ["private", "public", "unlisted"]
-        if v.lower() not in allowed:
-            raise ValueError(f"Privacy status must be one of {allowed}")
-        return v.lower()
-
-
-class PlaylistConfig(BaseModel):
-    """Playlist configuration model."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    create_if_not_exists: bool = Field(
-        default=True, description="Create playlist if doesn't exist"
-    )
-    default_playlist_privacy: str = Field(
-        default="private", description="Default playlist privacy"
-    )
-
-    @field_validator("default_playlist_privacy")
-    @classmethod
-    def validate_privacy(cls, v: str) -> str:
-        """Validate privacy status."""
-        allowed = ["private", "public", "unlisted"]
-        if v.lower() not in allowed:
-            raise ValueError(f"Privacy status must be one of {allowed}")
-        return v.lower()
-
-
-class APIConfig(BaseModel):
-    """API configuration model."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    quota_limit_per_day: int = Field(
-        default=10000, ge=1, description="Daily quota limit"
-    )
-    max_requests_per_minute: int = Field(
-        default=60, ge=1, le=100, description="Max requests per minute"
-    )
-
-
-class LoggingConfig(BaseModel):
-    """Logging configuration model."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    level: str = Field(default="INFO", description="Logging level")
-    log_directory: str = Field(default="./logs", description="Log directory path")
-    max_log_size_mb: int = Field(
-        default=50, ge=1, le=1000, description="Max log file size in MB"
-    )
-    backup_count: int = Field(
-        default=5, ge=1, le=100, description="Number of backup logs"
-    )
-
-    @field_validator("level")
-    @classmethod
-    def validate_level(cls, v: str) -> str:
-        """Validate logging level."""
-        allowed = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed:
-            raise ValueError(f"Log level must be one of {allowed}")
-        return v.upper()
-
+    from ._models import AppConfig, VideoMetadata, VideoMetadataConfig
 
-class AppConfig(BaseModel):
-    """Main application configuration model."""
+logger = logging.getLogger("youtube_uploader.config_parser")
 
-    model_config = ConfigDict(extra="allow")
+# Filename separators replaced with spaces when deriving fallback titles
+_TITLE_SEPARATORS = str.maketrans("_-", "  ")
 
-    paths: PathConfig = Field(default_factory=PathConfig)
-    upload: UploadConfig = Field(default_factory=UploadConfig)
-    playlist: PlaylistConfig = Field(default_factory=PlaylistConfig)
-    api: APIConfig = Field(default_factory=APIConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+# Parsed configs are cached here keyed by a hash of the config file contents
+CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "youtube-uploader"
+)
 
+# Bump when model definitions change so stale pickles are not reused
+CONFIG_CACHE_VERSION = 6
 
-class DefaultMetadata(BaseModel):
-    """Default metadata model."""
+# Set to "1" to build models without validation. Only safe for config
+# files this tool (or an equally trusted writer) produced.
+TRUSTED_CONFIG_ENV = "YTU_TRUSTED_CONFIG"
 
-    model_config = ConfigDict(extra="forbid")
+_MODEL_NAMES = {
+    "AppConfig",
+    "APIConfig",
+    "DefaultMetadata",
+    "FallbackConfig",
+    "LoggingConfig",
+    "PathConfig",
+    "PlaylistConfig",
+    "UploadConfig",
+    "VideoMetadata",
+    "VideoMetadataConfig",
+}
 
-    category_id: str = Field(default="22")
-    privacy_status: str = Field(default="private")
-    tags: List[str] = Field(default_factory=list)
-    language: str = Field(default="en")
-    playlist: Optional[str] = Field(default=None)
 
+@functools.lru_cache(maxsize=64)
+def _path_exists(path: str) -> bool:
+    """Return True if path exists; cached until ConfigParser.invalidate_paths()."""
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
 
-class FallbackConfig(BaseModel):
-    """Fallback configuration for missing metadata."""
 
-    model_config = ConfigDict(extra="forbid")
+def __getattr__(name: str) -> Any:
+    """Import the Pydantic models on first access (PEP 562)."""
+    if name in _MODEL_NAMES:
+        from . import _models
 
-    title_template: str = Field(default="{filename}")
-    description_template: str = Field(default="Uploaded on {date}")
-    use_filename_as_title: bool = Field(default=True)
+        return getattr(_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-class VideoMetadataConfig(BaseModel):
-    """Video metadata configuration container."""
+class ConfigValidationError(Exception):
+    """Raised when configuration validation fails for metadata loading."""
 
-    model_config = ConfigDict(extra="forbid")
+    def __init__(self, message: str):
+        """
+        Store a concise, user-facing message describing validation problems.
+        The full traceback is logged to file by the caller using logger.exception(...)
+        or logger.error(..., exc_info=True).
+        """
+        super().__init__(message)
+        self.message = message
 
-    default_metadata: DefaultMetadata = Field(default_factory=DefaultMetadata)
-    videos: List[VideoMetadata] = Field(default_factory=list)
-    fallback: FallbackConfig = Field(default_factory=FallbackConfig)
+    def __str__(self) -> str:
+        return self.message
 
 
 class ConfigParser:
@@ -221,13 +93,19 @@ class ConfigParser:
     Loads and validates JSON configuration files using Pydantic models.
     """
 
+    # Parsed models shared across instances, keyed by resolved file path and
+    # invalidated when the file's mtime or size changes
+    _load_cache: Dict[str, Tuple[Tuple[int, int], "BaseModel"]] = {}
+
     def __init__(self):
         """Initialize configuration parser."""
-        self.logger = logging.getLogger("youtube_uploader.config_parser")
-        self.app_config: Optional[AppConfig] = None
-        self.video_metadata_config: Optional[VideoMetadataConfig] = None
+        self.app_config: Optional["AppConfig"] = None
+        self.video_metadata_config: Optional["VideoMetadataConfig"] = None
+        self._video_index: Dict[str, int] = {}  # filename -> position in videos
+        self._validated_videos: Dict[str, "VideoMetadata"] = {}
+        self._fallback_base: Optional["VideoMetadata"] = None
 
-    def load_config(self, config_path: str) -> AppConfig:
+    def load_config(self, config_path: str) -> "AppConfig":
         """
         Load main application configuration.
 
@@ -241,29 +119,108 @@ class ConfigParser:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config validation fails
         """
+        from pydantic import ValidationError
+
+        from ._models import AppConfig, _construct_model
+
         config_file = Path(config_path)
 
-        if not config_file.exists():
-            self.logger.warning(f"Config file not found: {config_path}, using defaults")
+        try:
+            st = config_file.stat()
+        except FileNotFoundError:
+            logger.warning("Config file not found: %s, using defaults", config_path)
             self.app_config = AppConfig()
             return self.app_config
 
-        try:
-            with open(config_file, "r") as f:
-                config_data = json.load(f)
+        memo_key = f"config:{config_file.resolve()}"
+        stamp = (st.st_mtime_ns, st.st_size)
+        memo = self._load_cache.get(memo_key)
+        if memo is not None and memo[0] == stamp:
+            self.app_config = memo[1]
+            logger.debug("Configuration reused from %s", config_path)
+            return self.app_config
 
-            self.app_config = AppConfig(**config_data)
-            self.logger.info(f"Configuration loaded from {config_path}")
+        try:
+            raw = config_file.read_bytes()
+            cache_file = self._config_cache_path(raw)
+
+            cached = self._load_cached_config(cache_file)
+            if cached is not None:
+                self.app_config = cached
+                self._load_cache[memo_key] = (stamp, cached)
+                logger.info("Configuration loaded from %s (cached)", config_path)
+                return self.app_config
+
+            if self._trusted():
+                self.app_config = _construct_model(AppConfig, json_utils.loads(raw))
+            else:
+                # Parse and validate in a single pydantic-core pass
+                self.app_config = AppConfig.model_validate_json(raw)
+                self._store_cached_config(cache_file, self.app_config)
+            self._load_cache[memo_key] = (stamp, self.app_config)
+            logger.info("Configuration loaded from %s", config_path)
             return self.app_config
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in config file: {e}")
+        except json_utils.JSONDecodeError as e:
+            logger.error("Invalid JSON in config file: %s", e)
             raise ValueError(f"Invalid JSON in config file: {e}")
+        except ValidationError as e:
+            json_error = self._invalid_json_message(e)
+            if json_error is None:
+                logger.error("Failed to load config: %s", e)
+                raise
+            logger.error("Invalid JSON in config file: %s", json_error)
+            raise ValueError(f"Invalid JSON in config file: {json_error}")
         except Exception as e:
-            self.logger.error(f"Failed to load config: {e}")
+            logger.error("Failed to load config: %s", e)
             raise
 
-    def load_video_metadata(self, metadata_path: str) -> VideoMetadataConfig:
+    @staticmethod
+    def _invalid_json_message(error: "ValidationError") -> Optional[str]:
+        """Return the parser message if validation failed on malformed JSON."""
+        for err in error.errors():
+            if err.get("type") == "json_invalid":
+                return err.get("msg", str(error))
+        return None
+
+    @staticmethod
+    def _trusted() -> bool:
+        """Return True if validation should be skipped for trusted files."""
+        return os.environ.get(TRUSTED_CONFIG_ENV) == "1"
+
+    @staticmethod
+    def _config_cache_path(raw: bytes) -> Path:
+        """Return the cache file path for the given config file contents."""
+        digest = hashlib.sha256(raw).hexdigest()
+        return CONFIG_CACHE_DIR / f"config-v{CONFIG_CACHE_VERSION}-{digest}.pkl"
+
+    def _load_cached_config(self, cache_file: Path) -> Optional["AppConfig"]:
+        """Load a previously validated AppConfig from cache, if present."""
+        from ._models import AppConfig
+
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable config cache %s: %s", cache_file, e)
+            return None
+
+        return cached if isinstance(cached, AppConfig) else None
+
+    def _store_cached_config(self, cache_file: Path, config: "AppConfig"):
+        """Persist a validated AppConfig to cache; failures are non-fatal."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.debug("Failed to write config cache %s: %s", cache_file, e)
+
+    def load_video_metadata(self, metadata_path: str) -> "VideoMetadataConfig":
         """
         Load video metadata configuration.
 
@@ -277,69 +234,160 @@ class ConfigParser:
             FileNotFoundError: If metadata file doesn't exist
             ValueError: If metadata validation fails
         """
+        from pydantic import ValidationError
+
+        from ._models import VideoMetadataConfig, _construct_model
+
         metadata_file = Path(metadata_path)
 
-        if not metadata_file.exists():
-            self.logger.warning(
-                f"Metadata file not found: {metadata_path}, using defaults"
-            )
+        try:
+            st = metadata_file.stat()
+        except FileNotFoundError:
+            logger.warning("Metadata file not found: %s, using defaults", metadata_path)
             self.video_metadata_config = VideoMetadataConfig()
+            self._index_video_metadata()
             return self.video_metadata_config
 
-        try:
-            with open(metadata_file, "r") as f:
-                metadata_data = json.load(f)
+        memo_key = f"metadata:{metadata_file.resolve()}"
+        stamp = (st.st_mtime_ns, st.st_size)
+        memo = self._load_cache.get(memo_key)
+        if memo is not None and memo[0] == stamp:
+            self.video_metadata_config = memo[1]
+            self._index_video_metadata()
+            logger.debug("Video metadata reused from %s", metadata_path)
+            return self.video_metadata_config
 
-            self.video_metadata_config = VideoMetadataConfig(**metadata_data)
-            self.logger.info(f"Video metadata loaded from {metadata_path}")
-            self.logger.info(
-                f"Loaded metadata for {len(self.video_metadata_config.videos)} videos"
+        try:
+            if self._trusted():
+                self.video_metadata_config = _construct_model(
+                    VideoMetadataConfig, json_utils.load_file(metadata_file)
+                )
+            elif st.st_size >= json_utils.MMAP_THRESHOLD:
+                # Large files are parsed from an mmap to avoid a full copy
+                self.video_metadata_config = VideoMetadataConfig.model_validate(
+                    json_utils.load_file(metadata_file)
+                )
+            else:
+                # Parse and validate in a single pydantic-core pass
+                self.video_metadata_config = VideoMetadataConfig.model_validate_json(
+                    metadata_file.read_bytes()
+                )
+            self._load_cache[memo_key] = (stamp, self.video_metadata_config)
+            self._index_video_metadata()
+            logger.info("Video metadata loaded from %s", metadata_path)
+            logger.info(
+                "Loaded metadata for %s videos", len(self.video_metadata_config.videos)
             )
             return self.video_metadata_config
 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in metadata file: {e}")
+        except json_utils.JSONDecodeError as e:
+            logger.error("Invalid JSON in metadata file: %s", e)
             raise ValueError(f"Invalid JSON in metadata file: {e}")
         except ValidationError as e:
-            # Log full traceback at ERROR level so details are in log files
-            self.logger.error(
-                "Metadata validation failed while loading metadata", exc_info=True
-            )
-
-            # Build concise, user-friendly message from pydantic errors()
-            errors = e.errors()
-            header = f"Failed to load metadata: {len(errors)} validation errors"
-            lines = [header]
-            for err in errors:
-                loc = err.get("loc", [])
-                # Represent location as dot-separated string for readability
-                loc_str = ".".join(str(p) for p in loc)
-                msg = err.get("msg", "")
-                lines.append(f"- {loc_str}: {msg}")
-
-            lines.append(
-                "Suggestion: Make sure each video entry has a `filename` and `title` field. "
-                'Example: {"filename":"video.mp4","title":"My Title",...}'
-            )
-            user_message = "\n".join(lines)
-
-            # If rich is available, display in a red ERROR panel; otherwise print plain text
-            try:
-                from rich.console import Console
-                from rich.panel import Panel
-
-                Console().print(Panel(user_message, title="ERROR", style="red"))
-            except Exception:
-                print(user_message)
+            json_error = self._invalid_json_message(e)
+            if json_error is not None:
+                logger.error("Invalid JSON in metadata file: %s", json_error)
+                raise ValueError(f"Invalid JSON in metadata file: {json_error}")
 
             # Raise a custom exception so callers can handle programmatically
-            raise ConfigValidationError(user_message)
+            raise self._metadata_validation_error(e)
+        except ConfigValidationError:
+            raise
         except Exception as e:
             # Log full traceback for unexpected errors
-            self.logger.error(f"Failed to load metadata: {e}", exc_info=True)
+            logger.error("Failed to load metadata: %s", e, exc_info=True)
             raise
 
-    def get_video_metadata(self, filename: str) -> VideoMetadata:
+    def _metadata_validation_error(
+        self, error: "ValidationError", loc_prefix: Tuple[Any, ...] = ()
+    ) -> ConfigValidationError:
+        """
+        Log a metadata validation failure and build the user-facing error.
+
+        Must be called while handling the ValidationError so its traceback
+        is written to the log files.
+
+        Args:
+            error: Validation error raised by pydantic
+            loc_prefix: Location of the validated value within the file
+
+        Returns:
+            ConfigValidationError with a concise, user-friendly message
+        """
+        # Log full traceback at ERROR level so details are in log files
+        logger.error("Metadata validation failed while loading metadata", exc_info=True)
+
+        # Build concise, user-friendly message from pydantic errors()
+        errors = error.errors()
+        header = f"Failed to load metadata: {len(errors)} validation errors"
+        lines = [header]
+        for err in errors:
+            loc = loc_prefix + tuple(err.get("loc", ()))
+            # Represent location as dot-separated string for readability
+            loc_str = ".".join(str(p) for p in loc)
+            msg = err.get("msg", "")
+            lines.append(f"- {loc_str}: {msg}")
+
+        lines.append(
+            "Suggestion: Make sure each video entry has a `filename` and `title` field. "
+            'Example: {"filename":"video.mp4","title":"My Title",...}'
+        )
+        user_message = "\n".join(lines)
+
+        # If rich is available, display in a red ERROR panel; otherwise print plain text
+        try:
+            from rich.console import Console
+            from rich.panel import Panel
+
+            Console().print(Panel(user_message, title="ERROR", style="red"))
+        except Exception:
+            print(user_message)
+
+        return ConfigValidationError(user_message)
+
+    def _index_video_metadata(self):
+        """Build the filename -> entry position lookup for the loaded config."""
+        self._fallback_base = None
+        self._validated_videos = {}
+
+        index: Dict[str, int] = {}
+        for position, entry in enumerate(self.video_metadata_config.videos):
+            filename = entry.get("filename")
+            if not isinstance(filename, str):
+                # Unindexable entries are validated now so errors surface at load
+                self._validate_video_entry(position)
+                continue
+            # The first entry wins for duplicate filenames
+            index.setdefault(filename, position)
+        self._video_index = index
+
+    def _validate_video_entry(self, position: int) -> "VideoMetadata":
+        """
+        Validate a raw video entry from the loaded metadata config.
+
+        Args:
+            position: Index of the entry in the videos list
+
+        Returns:
+            Validated VideoMetadata
+
+        Raises:
+            ConfigValidationError: If the entry is invalid
+        """
+        from pydantic import ValidationError
+
+        from ._models import VideoMetadata, _construct_model
+
+        entry = self.video_metadata_config.videos[position]
+        if self._trusted():
+            return _construct_model(VideoMetadata, entry)
+
+        try:
+            return VideoMetadata.model_validate(entry)
+        except ValidationError as e:
+            raise self._metadata_validation_error(e, ("videos", position))
+
+    def get_video_metadata(self, filename: str) -> "VideoMetadata":
         """
         Get metadata for a specific video file.
 
@@ -348,22 +396,39 @@ class ConfigParser:
 
         Returns:
             VideoMetadata object (uses fallback if not found)
+
+        Raises:
+            ConfigValidationError: If the video's metadata entry is invalid
         """
         if not self.video_metadata_config:
-            self.logger.warning("Video metadata config not loaded, using defaults")
+            logger.warning("Video metadata config not loaded, using defaults")
             return self._create_fallback_metadata(filename)
 
-        # Search for matching filename
-        for video_meta in self.video_metadata_config.videos:
-            if video_meta.filename == filename:
-                self.logger.debug(f"Found metadata for {filename}")
-                return video_meta
+        video_meta = self._validated_videos.get(filename)
+        if video_meta is not None:
+            return video_meta
 
-        # Use fallback
-        self.logger.info(f"No metadata found for {filename}, using fallback")
-        return self._create_fallback_metadata(filename)
+        position = self._video_index.get(filename)
+        if position is None:
+            logger.info("No metadata found for %s, using fallback", filename)
+            return self._create_fallback_metadata(filename)
 
-    def _create_fallback_metadata(self, filename: str) -> VideoMetadata:
+        video_meta = self._validate_video_entry(position)
+        self._validated_videos[filename] = video_meta
+        return video_meta
+
+    def clear_cache(self):
+        """Drop cached parsed configs and the filename -> metadata index."""
+        self._load_cache.clear()
+        self.invalidate_paths()
+        self._video_index = {}
+        self._validated_videos = {}
+        self._fallback_base = None
+        self.__dict__.pop("_today_str", None)
+        self.app_config = None
+        self.video_metadata_config = None
+
+    def _create_fallback_metadata(self, filename: str) -> "VideoMetadata":
         """
         Create fallback metadata for a video.
 
@@ -373,6 +438,12 @@ class ConfigParser:
         Returns:
             VideoMetadata with fallback values
         """
+        from ._models import (
+            DEFAULT_DESCRIPTION_TEMPLATE,
+            VideoMetadata,
+            VideoMetadataConfig,
+        )
+
         if not self.video_metadata_config:
             self.video_metadata_config = VideoMetadataConfig()
 
@@ -382,26 +453,64 @@ class ConfigParser:
         # Generate title
         if fallback.use_filename_as_title:
             # Remove extension and clean up filename
-            title = Path(filename).stem.replace("_", " ").replace("-", " ")
+            title = os.path.splitext(filename)[0].translate(_TITLE_SEPARATORS)
         else:
             title = fallback.title_template.format(filename=filename)
 
         # Generate description
-        description = fallback.description_template.format(
-            date=datetime.now().strftime("%Y-%m-%d"), filename=filename
-        )
+        if fallback.description_template == DEFAULT_DESCRIPTION_TEMPLATE:
+            description = f"Uploaded on {self._today_str}"
+        else:
+            description = fallback.description_template.format(
+                date=self._today_str, filename=filename
+            )
 
-        return VideoMetadata(
-            filename=filename,
-            title=title,
-            description=description,
-            tags=defaults.tags,
-            category_id=defaults.category_id,
-            privacy_status=defaults.privacy_status,
-            playlist=defaults.playlist,
-            language=defaults.language,
+        if not title or len(title) > 100 or len(description) > 5000:
+            # Let full validation raise the usual error for out-of-range values
+            return VideoMetadata(
+                filename=filename,
+                title=title,
+                description=description,
+                tags=defaults.tags,
+                category_id=defaults.category_id,
+                privacy_status=defaults.privacy_status,
+                playlist=defaults.playlist,
+                language=defaults.language,
+            )
+
+        # Defaults are validated once per loaded config; per-file fields are
+        # bounds-checked above, so the copy can skip validation
+        if self._fallback_base is None:
+            self._fallback_base = VideoMetadata(
+                filename=filename,
+                title=title,
+                tags=defaults.tags,
+                category_id=defaults.category_id,
+                privacy_status=defaults.privacy_status,
+                playlist=defaults.playlist,
+                language=defaults.language,
+            )
+
+        base = self._fallback_base
+        return base.model_copy(
+            update={
+                "filename": filename,
+                "title": title,
+                "description": description,
+                "tags": list(base.tags),
+            }
         )
 
+    @functools.cached_property
+    def _today_str(self) -> str:
+        """Today's date for fallback descriptions, fixed for the run."""
+        return datetime.now().strftime("%Y-%m-%d")
+
+    @staticmethod
+    def invalidate_paths():
+        """Forget cached path existence checks used by validate_config."""
+        _path_exists.cache_clear()
+
     def validate_config(self) -> bool:
         """
         Validate loaded configuration.
@@ -411,19 +520,20 @@ class ConfigParser:
         """
         try:
             if not self.app_config:
-                self.logger.error("App configuration not loaded")
+                logger.error("App configuration not loaded")
                 return False
 
             # Validate paths exist or can be created
             paths = self.app_config.paths
-            videos_dir = Path(paths.videos_directory)
 
-            if not videos_dir.exists():
-                self.logger.warning(f"Videos directory does not exist: {videos_dir}")
+            if not _path_exists(paths.videos_directory):
+                logger.warning(
+                    "Videos directory does not exist: %s", paths.videos_directory
+                )
 
-            self.logger.info("Configuration validation successful")
+            logger.info("Configuration validation successful")
             return True
 
         except Exception as e:
-            self.logger.error(f"Configuration validation failed: {e}")
+            logger.error("Configuration validation failed: %s", e)
             return False
@@ -1,5 +1,5 @@
 """Playlist management module"""
 
-from .playlist_manager import PlaylistManager
+from .playlist_manager import PlaylistInfo, PlaylistManager, PlaylistVideo
 
-__all__ = ["PlaylistManager"]
+__all__ = ["PlaylistManager", "PlaylistInfo", "PlaylistVideo"]
@@ -5,10 +5,57 @@ Handles playlist creation, video addition, and playlist queries.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from googleapiclient.errors import HttpError
 
+logger = logging.getLogger("youtube_uploader.playlist_manager")
+
+# Partial-response masks limiting list calls to the fields read below
+PLAYLIST_LIST_FIELDS = (
+    "nextPageToken,items(id,snippet(title,description,publishedAt),"
+    "status/privacyStatus)"
+)
+PLAYLIST_ITEMS_FIELDS = (
+    "nextPageToken,items(id,snippet(title,position,publishedAt),"
+    "contentDetails/videoId)"
+)
+
+
+@dataclass
+class PlaylistInfo:
+    """Playlist returned by list_playlists."""
+
+    __slots__ = ("id", "title", "description", "privacy_status", "published_at")
+
+    id: str
+    title: str
+    description: str
+    privacy_status: str
+    published_at: Optional[str]
+
+    def __getitem__(self, key: str) -> Any:
+        """Support the dict-style access of the previous return type."""
+        return getattr(self, key)
+
+
+@dataclass
+class PlaylistVideo:
+    """Playlist entry returned by get_playlist_videos."""
+
+    __slots__ = ("playlist_item_id", "video_id", "title", "position", "published_at")
+
+    playlist_item_id: str
+    video_id: str
+    title: str
+    position: int
+    published_at: Optional[str]
+
+    def __getitem__(self, key: str) -> Any:
+        """Support the dict-style access of the previous return type."""
+        return getattr(self, key)
+
 
 class PlaylistManager:
     """
@@ -18,6 +65,9 @@ class PlaylistManager:
     and query existing playlists.
     """
 
+    # The API accepts at most this many calls in one batch request
+    MAX_BATCH_SIZE = 50
+
     def __init__(self, youtube_service):
         """
         Initialize playlist manager.
@@ -26,10 +76,13 @@ class PlaylistManager:
             youtube_service: Authenticated YouTube API service object
         """
         self.youtube = youtube_service
-        self.logger = logging.getLogger("youtube_uploader.playlist_manager")
 
         # Cache for playlist lookups
-        self._playlist_cache: Dict[str, str] = {}  # title -> playlist_id
+        # Keys are case-folded titles (see _key); values are playlist IDs
+        self._playlist_cache: Dict[str, str] = {}
+        self._canonical_titles: Dict[str, str] = {}  # folded -> original title
+        # True once a full listing has populated the cache, so misses are final
+        self._cache_complete = False
 
     def create_playlist(
         self, title: str, description: str = "", privacy_status: str = "private"
@@ -46,7 +99,7 @@ class PlaylistManager:
             Playlist ID if successful, None otherwise
         """
         try:
-            self.logger.info(f"Creating playlist: {title}")
+            logger.info("Creating playlist: %s", title)
 
             request_body = {
                 "snippet": {"title": title, "description": description},
@@ -61,23 +114,23 @@ class PlaylistManager:
             playlist_id = response.get("id")
 
             if playlist_id:
-                self.logger.info(f"Playlist created successfully. ID: {playlist_id}")
+                logger.info("Playlist created successfully. ID: %s", playlist_id)
                 # Cache the playlist
-                self._playlist_cache[title] = playlist_id
+                self._cache_playlist(title, playlist_id, replace=True)
                 return playlist_id
             else:
-                self.logger.error("Playlist creation failed: No ID in response")
+                logger.error("Playlist creation failed: No ID in response")
                 return None
 
         except HttpError as e:
-            self.logger.error(f"HTTP error creating playlist: {e}", exc_info=True)
+            logger.error("HTTP error creating playlist: %s", e, exc_info=True)
             return None
 
         except Exception as e:
-            self.logger.error(f"Failed to create playlist: {e}", exc_info=True)
+            logger.error("Failed to create playlist: %s", e, exc_info=True)
             return None
 
-    def list_playlists(self, max_results: int = 50) -> List[Dict[str, Any]]:
+    def list_playlists(self, max_results: int = 50) -> List[PlaylistInfo]:
         """
         List user's playlists.
 
@@ -85,45 +138,50 @@ class PlaylistManager:
             max_results: Maximum number of playlists to retrieve
 
         Returns:
-            List of playlist dictionaries
+            List of PlaylistInfo records
         """
         playlists = []
 
         try:
-            self.logger.debug("Fetching user playlists")
+            logger.debug("Fetching user playlists")
 
             request = self.youtube.playlists().list(
-                part="snippet,status", mine=True, maxResults=max_results
+                part="snippet,status",
+                mine=True,
+                maxResults=max_results,
+                fields=PLAYLIST_LIST_FIELDS,
             )
 
             while request:
                 response = request.execute()
 
                 for item in response.get("items", []):
-                    playlist_info = {
-                        "id": item["id"],
-                        "title": item["snippet"]["title"],
-                        "description": item["snippet"].get("description", ""),
-                        "privacy_status": item["status"]["privacyStatus"],
-                        "published_at": item["snippet"].get("publishedAt"),
-                    }
+                    snippet = item["snippet"]
+                    playlist_info = PlaylistInfo(
+                        item["id"],
+                        snippet["title"],
+                        snippet.get("description", ""),
+                        item["status"]["privacyStatus"],
+                        snippet.get("publishedAt"),
+                    )
                     playlists.append(playlist_info)
 
                     # Cache the playlist
-                    self._playlist_cache[playlist_info["title"]] = playlist_info["id"]
+                    self._cache_playlist(playlist_info.title, playlist_info.id)
 
                 # Check if there are more results
                 request = self.youtube.playlists().list_next(request, response)
 
-            self.logger.info(f"Found {len(playlists)} playlists")
+            self._cache_complete = True
+            logger.info("Found %s playlists", len(playlists))
             return playlists
 
         except HttpError as e:
-            self.logger.error(f"HTTP error listing playlists: {e}", exc_info=True)
+            logger.error("HTTP error listing playlists: %s", e, exc_info=True)
             return []
 
         except Exception as e:
-            self.logger.error(f"Failed to list playlists: {e}", exc_info=True)
+            logger.error("Failed to list playlists: %s", e, exc_info=True)
             return []
 
     def find_playlist_by_title(self, title: str) -> Optional[str]:
@@ -136,22 +194,53 @@ class PlaylistManager:
         Returns:
             Playlist ID if found, None otherwise
         """
+        key = self._key(title)
+
         # Check cache first
-        if title in self._playlist_cache:
-            self.logger.debug(f"Playlist '{title}' found in cache")
-            return self._playlist_cache[title]
+        playlist_id = self._playlist_cache.get(key)
+        if playlist_id is not None:
+            logger.debug("Playlist '%s' found in cache", self._canonical_titles[key])
+            return playlist_id
 
-        # Search through user's playlists
-        playlists = self.list_playlists()
+        # A full listing was already cached and the title is not in it
+        if self._cache_complete:
+            logger.info("Playlist '%s' not found", title)
+            return None
 
-        for playlist in playlists:
-            if playlist["title"] == title:
-                self.logger.info(f"Found playlist '{title}' with ID: {playlist['id']}")
-                return playlist["id"]
+        # Search through user's playlists; listing fills the cache
+        self.list_playlists()
 
-        self.logger.info(f"Playlist '{title}' not found")
+        playlist_id = self._playlist_cache.get(key)
+        if playlist_id is not None:
+            logger.info(
+                "Found playlist '%s' with ID: %s",
+                self._canonical_titles[key],
+                playlist_id,
+            )
+            return playlist_id
+
+        logger.info("Playlist '%s' not found", title)
         return None
 
+    @staticmethod
+    def _key(title: str) -> str:
+        """Normalize a playlist title for cache lookups."""
+        return title.casefold().strip()
+
+    def _cache_playlist(self, title: str, playlist_id: str, replace: bool = False):
+        """
+        Cache a playlist under its normalized title.
+
+        Args:
+            title: Playlist title as stored on YouTube
+            playlist_id: YouTube playlist ID
+            replace: Overwrite an existing entry for the same normalized title
+        """
+        key = self._key(title)
+        if replace or key not in self._playlist_cache:
+            self._playlist_cache[key] = playlist_id
+            self._canonical_titles[key] = title
+
     def get_or_create_playlist(
         self,
         title: str,
@@ -179,10 +268,10 @@ class PlaylistManager:
 
         # Create new playlist if requested
         if create_if_not_exists:
-            self.logger.info(f"Playlist '{title}' not found, creating new one")
+            logger.info("Playlist '%s' not found, creating new one", title)
             return self.create_playlist(title, description, privacy_status)
         else:
-            self.logger.warning(f"Playlist '{title}' not found and creation disabled")
+            logger.warning("Playlist '%s' not found and creation disabled", title)
             return None
 
     def add_video_to_playlist(
@@ -200,45 +289,125 @@ class PlaylistManager:
             True if successful, False otherwise
         """
         try:
-            self.logger.info(f"Adding video {video_id} to playlist {playlist_id}")
-
-            request_body = {
-                "snippet": {
-                    "playlistId": playlist_id,
-                    "resourceId": {"kind": "youtube#video", "videoId": video_id},
-                }
-            }
-
-            # Add position if specified
-            if position is not None:
-                request_body["snippet"]["position"] = position
+            logger.info("Adding video %s to playlist %s", video_id, playlist_id)
 
             request = self.youtube.playlistItems().insert(
-                part="snippet", body=request_body
+                part="snippet",
+                body=self._playlist_item_body(video_id, playlist_id, position),
             )
 
             response = request.execute()
 
             if response.get("id"):
-                self.logger.info(
-                    f"Video added to playlist successfully. "
-                    f"Playlist item ID: {response['id']}"
+                logger.info(
+                    "Video added to playlist successfully. Playlist item ID: %s",
+                    response["id"],
                 )
                 return True
             else:
-                self.logger.error("Failed to add video to playlist: No ID in response")
+                logger.error("Failed to add video to playlist: No ID in response")
                 return False
 
         except HttpError as e:
-            self.logger.error(
-                f"HTTP error adding video to playlist: {e}", exc_info=True
-            )
+            logger.error("HTTP error adding video to playlist: %s", e, exc_info=True)
             return False
 
         except Exception as e:
-            self.logger.error(f"Failed to add video to playlist: {e}", exc_info=True)
+            logger.error("Failed to add video to playlist: %s", e, exc_info=True)
             return False
 
+    def add_videos_to_playlist(
+        self, items: List[Tuple[str, str]], errors: Optional[Dict[int, int]] = None
+    ) -> List[bool]:
+        """
+        Add several videos to playlists using batched API requests.
+
+        Up to MAX_BATCH_SIZE inserts are sent in each HTTP round-trip.
+
+        Args:
+            items: (video_id, playlist_id) pairs
+            errors: Optional dict filled with the HTTP status of each insert
+                the API rejected, keyed by its index in items
+
+        Returns:
+            Success flag for each pair, in input order
+        """
+        results = [False] * len(items)
+
+        def on_added(request_id: str, response: Dict[str, Any], exception):
+            index = int(request_id)
+            video_id, playlist_id = items[index]
+            if exception is not None:
+                if (
+                    errors is not None
+                    and isinstance(exception, HttpError)
+                    and exception.resp is not None
+                ):
+                    errors[index] = exception.resp.status
+                logger.error(
+                    "HTTP error adding video %s to playlist %s: %s",
+                    video_id,
+                    playlist_id,
+                    exception,
+                )
+            elif response and response.get("id"):
+                results[index] = True
+                logger.debug(
+                    "Video %s added to playlist %s. Playlist item ID: %s",
+                    video_id,
+                    playlist_id,
+                    response["id"],
+                )
+            else:
+                logger.error(
+                    "Failed to add video %s to playlist: No ID in response", video_id
+                )
+
+        for start in range(0, len(items), self.MAX_BATCH_SIZE):
+            chunk = range(start, min(start + self.MAX_BATCH_SIZE, len(items)))
+            batch = self.youtube.new_batch_http_request(callback=on_added)
+            for index in chunk:
+                video_id, playlist_id = items[index]
+                batch.add(
+                    self.youtube.playlistItems().insert(
+                        part="snippet",
+                        body=self._playlist_item_body(video_id, playlist_id),
+                    ),
+                    request_id=str(index),
+                )
+
+            try:
+                logger.info("Adding %s videos to playlists in a batch", len(chunk))
+                batch.execute()
+
+            except HttpError as e:
+                logger.error(
+                    "HTTP error adding videos to playlists: %s", e, exc_info=True
+                )
+
+            except Exception as e:
+                logger.error("Failed to add videos to playlists: %s", e, exc_info=True)
+
+        return results
+
+    @staticmethod
+    def _playlist_item_body(
+        video_id: str, playlist_id: str, position: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for a playlistItems.insert call."""
+        request_body = {
+            "snippet": {
+                "playlistId": playlist_id,
+                "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            }
+        }
+
+        # Add position if specified
+        if position is not None:
+            request_body["snippet"]["position"] = position
+
+        return request_body
+
     def remove_video_from_playlist(self, playlist_item_id: str) -> bool:
         """
         Remove a video from a playlist.
@@ -250,29 +419,27 @@ class PlaylistManager:
             True if successful, False otherwise
         """
         try:
-            self.logger.info(f"Removing playlist item {playlist_item_id}")
+            logger.info("Removing playlist item %s", playlist_item_id)
 
             request = self.youtube.playlistItems().delete(id=playlist_item_id)
 
             request.execute()
-            self.logger.info("Video removed from playlist successfully")
+            logger.info("Video removed from playlist successfully")
             return True
 
         except HttpError as e:
-            self.logger.error(
-                f"HTTP error removing video from playlist: {e}", exc_info=True
+            logger.error(
+                "HTTP error removing video from playlist: %s", e, exc_info=True
             )
             return False
 
         except Exception as e:
-            self.logger.error(
-                f"Failed to remove video from playlist: {e}", exc_info=True
-            )
+            logger.error("Failed to remove video from playlist: %s", e, exc_info=True)
             return False
 
     def get_playlist_videos(
         self, playlist_id: str, max_results: int = 50
-    ) -> List[Dict[str, Any]]:
+    ) -> List[PlaylistVideo]:
         """
         Get videos in a playlist.
 
@@ -281,49 +448,52 @@ class PlaylistManager:
             max_results: Maximum number of videos to retrieve
 
         Returns:
-            List of video information dictionaries
+            List of PlaylistVideo records
         """
         videos = []
 
         try:
-            self.logger.debug(f"Fetching videos for playlist {playlist_id}")
+            logger.debug("Fetching videos for playlist %s", playlist_id)
 
             request = self.youtube.playlistItems().list(
                 part="snippet,contentDetails",
                 playlistId=playlist_id,
                 maxResults=max_results,
+                fields=PLAYLIST_ITEMS_FIELDS,
             )
 
             while request:
                 response = request.execute()
 
                 for item in response.get("items", []):
-                    video_info = {
-                        "playlist_item_id": item["id"],
-                        "video_id": item["contentDetails"]["videoId"],
-                        "title": item["snippet"]["title"],
-                        "position": item["snippet"]["position"],
-                        "published_at": item["snippet"].get("publishedAt"),
-                    }
-                    videos.append(video_info)
+                    snippet = item["snippet"]
+                    videos.append(
+                        PlaylistVideo(
+                            item["id"],
+                            item["contentDetails"]["videoId"],
+                            snippet["title"],
+                            snippet["position"],
+                            snippet.get("publishedAt"),
+                        )
+                    )
 
                 # Check if there are more results
                 request = self.youtube.playlistItems().list_next(request, response)
 
-            self.logger.info(f"Found {len(videos)} videos in playlist")
+            logger.info("Found %s videos in playlist", len(videos))
             return videos
 
         except HttpError as e:
-            self.logger.error(
-                f"HTTP error fetching playlist videos: {e}", exc_info=True
-            )
+            logger.error("HTTP error fetching playlist videos: %s", e, exc_info=True)
             return []
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch playlist videos: {e}", exc_info=True)
+            logger.error("Failed to fetch playlist videos: %s", e, exc_info=True)
             return []
 
     def clear_cache(self):
         """Clear the playlist cache."""
         self._playlist_cache.clear()
-        self.logger.debug("Playlist cache cleared")
+        self._canonical_titles.clear()
+        self._cache_complete = False
+        logger.debug("Playlist cache cleared")
@@ -5,23 +5,114 @@ Handles video uploads to YouTube with chunked resumable uploads,
 progress tracking, and retry logic.
 """
 
+import copy
+import functools
 import logging
+import mmap
+import os
+import queue
+import stat
 import sys
+import threading
 import time
-from pathlib import Path
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from googleapiclient.errors import HttpError, ResumableUploadError
-from googleapiclient.http import MediaFileUpload
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from googleapiclient.http import MediaIoBaseUpload
 
 from ..config.config_parser import VideoMetadata
 
+if TYPE_CHECKING:
+    from ..utils.rate_limiter import RateLimiter
+
+_STOP = object()
+
+
+@functools.lru_cache(maxsize=1)
+def _rich_progress_api() -> Optional[SimpleNamespace]:
+    """
+    Import the Rich progress classes on first use.
+
+    Rich is only needed when an upload renders its own progress bar, so
+    the import is deferred until then and attempted once per process.
+
+    Returns:
+        Namespace of Rich classes, or None if Rich is unavailable
+    """
+    try:
+        from rich.console import Console
+        from rich.progress import (
+            BarColumn,
+            DownloadColumn,
+            Progress,
+            TextColumn,
+            TimeRemainingColumn,
+            TransferSpeedColumn,
+        )
+    except Exception:
+        return None
+
+    return SimpleNamespace(
+        Console=Console,
+        Progress=Progress,
+        BarColumn=BarColumn,
+        DownloadColumn=DownloadColumn,
+        TextColumn=TextColumn,
+        TimeRemainingColumn=TimeRemainingColumn,
+        TransferSpeedColumn=TransferSpeedColumn,
+    )
+
+
+class _ProgressDispatcher:
+    """
+    Deliver progress callbacks from a daemon thread.
+
+    Holds at most one pending update; a newer update replaces one that
+    has not been delivered yet, so a slow callback never delays the
+    next upload chunk.
+    """
+
+    def __init__(self, callback, logger: logging.Logger):
+        self._callback = callback
+        self._logger = logger
+        self._queue = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(
+            target=self._run, name="upload-progress", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, *args):
+        """Queue an update, replacing any undelivered one."""
+        while True:
+            try:
+                self._queue.put_nowait(args)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def close(self):
+        """Deliver the pending update, then stop the worker thread."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            update = self._queue.get()
+            if update is _STOP:
+                return
+            try:
+                self._callback(*update)
+            except Exception:
+                # Ensure UI errors don't break upload
+                self._logger.debug(
+                    "Progress callback raised an exception", exc_info=True
+                )
+
 
 class VideoUploader:
     """
@@ -32,47 +123,92 @@ class VideoUploader:
     """
 
     # Supported video formats
-    SUPPORTED_FORMATS = {
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".mkv",
-        ".ts",
-        ".mpeg",
-        ".mpg",
-        ".m4v",
-        ".3gp",
-    }
+    SUPPORTED_FORMATS: FrozenSet[str] = frozenset(
+        {
+            ".mp4",
+            ".avi",
+            ".mov",
+            ".wmv",
+            ".flv",
+            ".webm",
+            ".mkv",
+            ".ts",
+            ".mpeg",
+            ".mpg",
+            ".m4v",
+            ".3gp",
+        }
+    )
+    _SUPPORTED_FORMATS_STR = ", ".join(sorted(SUPPORTED_FORMATS))
+
+    # Server errors worth retrying a chunk for
+    _RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+    # Resource parts set by prepare_upload_request
+    _INSERT_PARTS = "snippet,status"
 
     # Maximum file size (256 GB as per YouTube limits)
     MAX_FILE_SIZE = 256 * 1024 * 1024 * 1024
 
+    # Resumable upload chunks must be a multiple of 256 KB
+    CHUNK_MULTIPLE = 256 * 1024
+
+    # Upper bound on the backoff between chunk retries, in seconds
+    MAX_RETRY_DELAY = 300
+
+    # Chunk sizes below this spend much of the upload on per-chunk round trips
+    MIN_EFFICIENT_CHUNK_MB = 8
+
     def __init__(
         self,
         youtube_service,
-        chunk_size_mb: int = 10,
+        chunk_size_mb: int = 100,
         max_retries: int = 5,
         retry_delay: int = 2,
+        min_cb_interval: float = 0.1,
     ):
         """
         Initialize video uploader.
 
         Args:
             youtube_service: Authenticated YouTube API service object
-            chunk_size_mb: Upload chunk size in megabytes
+            chunk_size_mb: Upload chunk size in megabytes, or -1 to send the
+                whole file in a single request. Every chunk costs an HTTP round
+                trip, so larger chunks upload faster on high-latency links at
+                the cost of holding more of the file in memory per request.
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay in seconds for exponential backoff
+            min_cb_interval: Minimum seconds between progress callbacks
+
+        Raises:
+            ValueError: If chunk_size_mb is not -1 or a positive multiple of 256 KB
         """
         self.youtube = youtube_service
-        self.chunk_size = chunk_size_mb * 1024 * 1024  # Convert to bytes
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.min_cb_interval = min_cb_interval
 
         self.logger = logging.getLogger("youtube_uploader.video_uploader")
 
+        # Per-thread copies created by for_current_thread
+        self._thread_local = threading.local()
+
+        if chunk_size_mb == -1:
+            self.chunk_size = -1  # Single request, no chunking
+        else:
+            self.chunk_size = int(chunk_size_mb * 1024 * 1024)  # Convert to bytes
+            if self.chunk_size <= 0 or self.chunk_size % self.CHUNK_MULTIPLE:
+                raise ValueError(
+                    f"Invalid chunk size: {chunk_size_mb} MB. "
+                    "Use -1 or a positive multiple of 256 KB"
+                )
+            if chunk_size_mb < self.MIN_EFFICIENT_CHUNK_MB:
+                self.logger.warning(
+                    "Chunk size %s MB is small; uploads will be slowed by per-chunk "
+                    "round trips",
+                    chunk_size_mb,
+                )
+
     def validate_video_file(self, video_path: str) -> bool:
         """
         Validate video file before upload.
@@ -83,43 +219,58 @@ class VideoUploader:
         Returns:
             True if valid, False otherwise
         """
-        path = Path(video_path)
+        return self._validated_size(video_path) is not None
+
+    def _validated_size(self, video_path: str) -> Optional[int]:
+        """
+        Validate a video file with a single stat call.
 
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            File size in bytes if valid, None otherwise
+        """
         # Check if file exists
-        if not path.exists():
-            self.logger.error(f"Video file not found: {video_path}")
-            return False
+        try:
+            st = os.stat(video_path)
+        except (FileNotFoundError, NotADirectoryError):
+            self.logger.error("Video file not found: %s", video_path)
+            return None
 
         # Check if it's a file
-        if not path.is_file():
-            self.logger.error(f"Path is not a file: {video_path}")
-            return False
+        if not stat.S_ISREG(st.st_mode):
+            self.logger.error("Path is not a file: %s", video_path)
+            return None
 
         # Check file extension
-        if path.suffix.lower() not in self.SUPPORTED_FORMATS:
+        suffix = os.path.splitext(video_path)[1]
+        if suffix.lower() not in self.SUPPORTED_FORMATS:
             self.logger.error(
-                f"Unsupported video format: {path.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+                "Unsupported video format: %s. Supported formats: %s",
+                suffix,
+                self._SUPPORTED_FORMATS_STR,
             )
-            return False
+            return None
 
         # Check file size
-        file_size = path.stat().st_size
+        file_size = st.st_size
         if file_size > self.MAX_FILE_SIZE:
             self.logger.error(
-                f"File too large: {file_size / (1024**3):.2f} GB. "
-                f"Maximum: {self.MAX_FILE_SIZE / (1024**3):.0f} GB"
+                "File too large: %.2f GB. Maximum: %.0f GB",
+                file_size / (1024**3),
+                self.MAX_FILE_SIZE / (1024**3),
             )
-            return False
+            return None
 
         if file_size == 0:
-            self.logger.error(f"File is empty: {video_path}")
-            return False
+            self.logger.error("File is empty: %s", video_path)
+            return None
 
         self.logger.debug(
-            f"Video file validated: {video_path} ({file_size / (1024**2):.2f} MB)"
+            "Video file validated: %s (%.2f MB)", video_path, file_size / (1024**2)
         )
-        return True
+        return file_size
 
     def is_valid_video_file(self, video_path: str) -> bool:
         """
@@ -141,7 +292,7 @@ class VideoUploader:
             metadata: Video metadata
 
         Returns:
-            Request body dictionary
+            Request body dictionary with the parts named in _INSERT_PARTS
         """
         body = {
             "snippet": {
@@ -157,27 +308,27 @@ class VideoUploader:
             },
         }
 
-        self.logger.debug(f"Prepared upload request for: {metadata.title}")
+        self.logger.debug("Prepared upload request for: %s", metadata.title)
         return body
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=2, max=300),
-        retry=retry_if_exception_type(
-            (HttpError, ResumableUploadError, ConnectionError)
-        ),
-        reraise=True,
-    )
     def _execute_upload_with_retry(
         self, request, total_size: Optional[int] = None, progress_callback=None
     ) -> Dict[str, Any]:
         """
         Execute upload request with retry logic and optional progress callbacks.
 
+        Failed chunks are retried in place with exponential backoff, so the
+        resumable upload continues from the last acknowledged byte.
+
+        Progress callbacks are coalesced to at most one per min_cb_interval
+        seconds, plus a final call once the upload completes. They run on a
+        background thread, so the next chunk is sent without waiting for
+        the callback; updates the callback cannot keep up with are dropped.
+
         Args:
             request: Upload request object
             total_size: Total size of the file in bytes (used for ETA/speed)
-            progress_callback: Optional callable called with
+            progress_callback: Optional callable called positionally with
                 (fraction: float, bytes_uploaded: int, elapsed: float, speed_bps: float)
 
         Returns:
@@ -185,61 +336,104 @@ class VideoUploader:
         """
         response = None
         error_count = 0
-
-        start_time = time.time()
-        while response is None:
-            try:
-                status, response = request.next_chunk()
-
-                if status and total_size:
-                    fraction = status.progress()  # 0.0 .. 1.0
-                    bytes_uploaded = int(fraction * total_size)
-                    elapsed = max(1e-6, time.time() - start_time)
-                    speed_bps = bytes_uploaded / elapsed if elapsed > 0 else 0.0
-
-                    # Inform any UI progress callback
-                    try:
-                        if progress_callback:
-                            progress_callback(
-                                fraction=fraction,
-                                bytes_uploaded=bytes_uploaded,
-                                elapsed=elapsed,
-                                speed_bps=speed_bps,
+        report_progress = progress_callback is not None and bool(total_size)
+        min_interval = self.min_cb_interval
+        last_callback = 0.0
+
+        # Callbacks run on a worker thread so they never delay next_chunk()
+        dispatcher = None
+        if report_progress:
+            dispatcher = _ProgressDispatcher(progress_callback, self.logger)
+            progress_callback = dispatcher.submit
+
+        clock = time.time
+        start_time = clock()
+        try:
+            while response is None:
+                try:
+                    status, response = request.next_chunk()
+
+                    if status and report_progress:
+                        now = clock()
+                        fraction = status.progress()  # 0.0 .. 1.0
+                        if fraction >= 1.0 or now - last_callback >= min_interval:
+                            last_callback = now
+                            self._report_progress(
+                                progress_callback,
+                                fraction,
+                                total_size,
+                                now - start_time,
                             )
-                    except Exception:
-                        # Ensure UI errors don't break upload
-                        self.logger.debug(
-                            "Progress callback raised an exception", exc_info=True
+
+                except HttpError as e:
+                    status_code = e.resp.status if e.resp is not None else None
+                    if status_code in self._RETRYABLE_STATUS:
+                        # Retryable server errors
+                        error_count += 1
+                        self.logger.warning(
+                            "Retryable HTTP error %s: %s", status_code, e
                         )
+                        if error_count > self.max_retries:
+                            raise
+                        self._backoff(error_count)
+                    else:
+                        # Non-retryable error
+                        self.logger.error("Non-retryable HTTP error: %s", e)
+                        raise
 
-            except HttpError as e:
-                if getattr(e, "resp", None) and getattr(e.resp, "status", None) in [
-                    500,
-                    502,
-                    503,
-                    504,
-                ]:
-                    # Retryable server errors
+                except (ResumableUploadError, ConnectionError) as e:
+                    # Handle resumable upload and network errors
                     error_count += 1
-                    self.logger.warning(f"Retryable HTTP error {e.resp.status}: {e}")
+                    self.logger.warning("Resumable upload error: %s", e)
                     if error_count > self.max_retries:
                         raise
-                    time.sleep(self.retry_delay * (2**error_count))
-                else:
-                    # Non-retryable error
-                    self.logger.error(f"Non-retryable HTTP error: {e}")
-                    raise
-
-            except ResumableUploadError as e:
-                # Handle resumable upload errors
-                error_count += 1
-                self.logger.warning(f"Resumable upload error: {e}")
-                if error_count > self.max_retries:
-                    raise
-                time.sleep(self.retry_delay * (2**error_count))
+                    self._backoff(error_count)
+
+            # The final chunk returns no status; report completion explicitly
+            if report_progress:
+                self._report_progress(
+                    progress_callback, 1.0, total_size, clock() - start_time
+                )
+        finally:
+            # Flush the last update before the caller tears down its UI
+            if dispatcher is not None:
+                dispatcher.close()
 
         return response
 
+    def _backoff(self, error_count: int):
+        """Sleep before retrying a chunk, doubling the delay per error."""
+        time.sleep(min(self.MAX_RETRY_DELAY, self.retry_delay * (2**error_count)))
+
+    def _report_progress(
+        self, progress_callback, fraction: float, total_size: int, elapsed: float
+    ):
+        """Compute transfer stats and hand them to a progress callback."""
+        bytes_uploaded = int(fraction * total_size)
+        elapsed = max(1e-6, elapsed)
+        speed_bps = bytes_uploaded / elapsed
+
+        # Inform any UI progress callback
+        progress_callback(fraction, bytes_uploaded, elapsed, speed_bps)
+
+    @staticmethod
+    def _advise_sequential(fd: int):
+        """
+        Hint the kernel that a file will be read once, front to back.
+
+        Deepens readahead and lets pages be dropped after use, keeping
+        multi-GB uploads from crowding out the page cache. No-op where
+        posix_fadvise is unavailable.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+        except OSError:
+            # Advice is best-effort; some filesystems reject it
+            pass
+
     def upload_video(
         self, video_path: str, metadata: VideoMetadata, progress_callback=None
     ) -> Optional[str]:
@@ -249,66 +443,53 @@ class VideoUploader:
         Args:
             video_path: Path to video file
             metadata: Video metadata
-            progress_callback: Optional callback for progress updates.
+            progress_callback: Optional callback for progress updates, called
+                positionally with (fraction, bytes_uploaded, elapsed, speed_bps).
                 If None, a lightweight Rich progress UI will be used internally.
 
         Returns:
             Video ID if successful, None otherwise
         """
-        # Validate video file
-        if not self.validate_video_file(video_path):
+        # Validate video file; the size comes from the same stat call
+        file_size = self._validated_size(video_path)
+        if file_size is None:
             return None
 
-        # Lazy import rich components and provide a backwards-compatible progress UI with safe fallback
-        try:
-            from rich.console import Console
-            from rich.progress import (
-                BarColumn,
-                DownloadColumn,
-                Progress,
-                TextColumn,
-                TimeRemainingColumn,
-                TransferSpeedColumn,
-            )
-
-            rich_available = True
-        except Exception:
-            rich_available = False
+        # Rich is imported once on first use; fall back to the textual reporter
+        rich = _rich_progress_api()
 
+        video_map = None
         try:
-            path = Path(video_path)
-            file_size = path.stat().st_size
+            filename = os.path.basename(video_path)
 
             self.logger.info(
-                f"Starting upload: {metadata.title} ({file_size / (1024**2):.2f} MB)"
+                "Starting upload: %s (%.2f MB)", metadata.title, file_size / (1024**2)
             )
 
             # Prepare request body
             body = self.prepare_upload_request(video_path, metadata)
 
+            # Map the file read-only so chunks are sliced from the page cache
+            # rather than read through a buffered file object
+            with open(video_path, "rb") as video_file:
+                self._advise_sequential(video_file.fileno())
+                video_map = mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                video_map.madvise(mmap.MADV_SEQUENTIAL)
+
             # Create media upload object with resumable upload
-            media = MediaFileUpload(
-                video_path,
+            media = MediaIoBaseUpload(
+                video_map,
+                mimetype="video/*",
                 chunksize=self.chunk_size,
                 resumable=True,
-                mimetype="video/*",
             )
 
             # Create insert request
             request = self.youtube.videos().insert(
-                part=",".join(body.keys()), body=body, media_body=media
+                part=self._INSERT_PARTS, body=body, media_body=media
             )
 
-            # Build stable column set (works across rich versions)
-            progress_columns = [
-                TextColumn("{task.fields[filename]}", justify="left"),
-                BarColumn(bar_width=None),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                DownloadColumn(),
-                TransferSpeedColumn(),
-                TimeRemainingColumn(),
-            ]
-
             # If no external progress_callback provided and rich is available, create one lazily
             progress = None
             console = None
@@ -321,36 +502,61 @@ class VideoUploader:
                 """
 
                 class TextualReporter:
+                    # Minimum seconds between repaints, and between repaints
+                    # that only refresh speed/ETA at an unchanged percentage
+                    MIN_PAINT_INTERVAL = 0.1
+                    MIN_REFRESH_INTERVAL = 1.0
+
                     def __init__(self):
                         self.last_percent = -1
+                        self.last_painted_percent = -1
+                        self.last_emit = 0.0
                         self.total = total_bytes
+                        self.inv_total = 1.0 / max(1, total_bytes)
                         self.filename = filename
                         self.start_time = time.time()
 
                     def update(self, completed_bytes):
-                        frac = min(1.0, completed_bytes / max(1, self.total))
-                        pct = int(frac * 100)
-                        elapsed = max(1e-6, time.time() - self.start_time)
-                        speed = completed_bytes / elapsed if elapsed > 0 else 0.0
+                        now = time.time()
+                        pct = min(100, int(completed_bytes * self.inv_total * 100))
+
+                        # Skip repaints that would not visibly change the line
+                        if pct != 100:
+                            since_emit = now - self.last_emit
+                            if since_emit < self.MIN_PAINT_INTERVAL or (
+                                pct == self.last_painted_percent
+                                and since_emit < self.MIN_REFRESH_INTERVAL
+                            ):
+                                return
+                        self.last_emit = now
+                        self.last_painted_percent = pct
+
+                        elapsed = max(1e-6, now - self.start_time)
+                        speed = completed_bytes / elapsed
                         speed_mb = speed / (1024 * 1024)
                         remaining = max(0, self.total - completed_bytes)
-                        eta = remaining / speed if speed > 0 else float("inf")
-                        eta_str = f"{int(eta)}s" if eta != float("inf") else "?"
+                        eta_str = f"{int(remaining / speed)}s" if speed > 0 else "?"
 
                         # Use carriage return for inline updates
-                        progress_msg = (
+                        write = sys.stdout.write
+                        flush = sys.stdout.flush
+                        write(
                             f"\rUpload progress: {pct}% "
                             f"({completed_bytes}/{self.total} bytes) "
                             f"Speed: {speed_mb:.1f} MB/s ETA: {eta_str}"
                         )
-                        sys.stdout.write(progress_msg)
-                        sys.stdout.flush()
+                        flush()
 
-                        # Log to file only at intervals to avoid spam
-                        if pct != self.last_percent and (pct % 10 == 0 or pct == 100):
+                        # Log to file only at 10% steps to avoid spam
+                        if pct // 10 != self.last_percent // 10:
                             logger.debug(
-                                f"{self.filename}: {pct}% ({completed_bytes}/{self.total}) "
-                                f"Speed: {speed_mb:.1f} MB/s ETA={eta_str}"
+                                "%s: %s%% (%s/%s) Speed: %.1f MB/s ETA=%s",
+                                self.filename,
+                                pct,
+                                completed_bytes,
+                                self.total,
+                                speed_mb,
+                                eta_str,
                             )
                             self.last_percent = pct
 
@@ -362,10 +568,21 @@ class VideoUploader:
                 return TextualReporter()
 
             # Create the progress UI if appropriate
-            if progress_callback is None and rich_available:
+            if progress_callback is None and rich is not None:
                 try:
-                    console = Console()
-                    progress = Progress(
+                    # Build stable column set (works across rich versions)
+                    progress_columns = [
+                        rich.TextColumn("{task.fields[filename]}", justify="left"),
+                        rich.BarColumn(bar_width=None),
+                        rich.TextColumn(
+                            "[progress.percentage]{task.percentage:>3.0f}%"
+                        ),
+                        rich.DownloadColumn(),
+                        rich.TransferSpeedColumn(),
+                        rich.TimeRemainingColumn(),
+                    ]
+                    console = rich.Console()
+                    progress = rich.Progress(
                         *progress_columns, console=console, transient=True
                     )
                     # Add task within the context manager scope when actual updates will run
@@ -383,19 +600,24 @@ class VideoUploader:
             if progress is not None:
                 with progress:
                     task_id = progress.add_task(
-                        "upload", filename=path.name, total=file_size
+                        "upload", filename=filename, total=file_size
                     )
 
-                    # Internal callback updates rich progress
-                    def _internal_progress_callback(**kwargs):
-                        try:
-                            completed = kwargs.get("bytes_uploaded", 0)
-                            progress.update(task_id, completed=completed)
-                        except Exception:
-                            # Ensure UI errors don't break upload
-                            self.logger.debug(
-                                "Rich progress update failed", exc_info=True
-                            )
+                    last_pct = -1
+                    pct_scale = 100.0 / file_size
+
+                    # Internal callback updates rich progress; errors are
+                    # caught and logged by the progress dispatcher. Only
+                    # re-render when the whole percentage changes.
+                    def _internal_progress_callback(
+                        fraction, bytes_uploaded, elapsed, speed_bps
+                    ):
+                        nonlocal last_pct
+                        pct = int(bytes_uploaded * pct_scale)
+                        if pct == last_pct:
+                            return
+                        last_pct = pct
+                        progress.update(task_id, completed=bytes_uploaded)
 
                     start_time = time.time()
                     response = self._execute_upload_with_retry(
@@ -409,17 +631,13 @@ class VideoUploader:
                 # Setup textual reporter fallback or use provided callback
                 if progress_callback is None:
                     textual_reporter = make_textual_reporter(
-                        self.logger, path.name, file_size
+                        self.logger, filename, file_size
                     )
 
-                    def _internal_progress_callback(**kwargs):
-                        try:
-                            completed = kwargs.get("bytes_uploaded", 0)
-                            textual_reporter.update(completed)
-                        except Exception:
-                            self.logger.debug(
-                                "Textual progress update failed", exc_info=True
-                            )
+                    def _internal_progress_callback(
+                        fraction, bytes_uploaded, elapsed, speed_bps
+                    ):
+                        textual_reporter.update(bytes_uploaded)
 
                     chosen_callback = _internal_progress_callback
 
@@ -444,8 +662,9 @@ class VideoUploader:
 
             if video_id:
                 self.logger.info(
-                    f"Upload completed successfully. Video ID: {video_id} "
-                    f"(Duration: {upload_duration:.2f}s)"
+                    "Upload completed successfully. Video ID: %s (Duration: %.2fs)",
+                    video_id,
+                    upload_duration,
                 )
                 return video_id
             else:
@@ -453,13 +672,117 @@ class VideoUploader:
                 return None
 
         except HttpError as e:
-            self.logger.error(f"HTTP error during upload: {e}", exc_info=True)
+            self.logger.error("HTTP error during upload: %s", e, exc_info=True)
             return None
 
         except Exception as e:
-            self.logger.error(f"Upload failed: {e}", exc_info=True)
+            self.logger.error("Upload failed: %s", e, exc_info=True)
             return None
 
+        finally:
+            if video_map is not None:
+                video_map.close()
+
+    @staticmethod
+    def discard_progress(*_):
+        """Progress callback that ignores updates, for workers without a display."""
+
+    def for_current_thread(
+        self, service_factory: Optional[Callable[[], Any]]
+    ) -> "VideoUploader":
+        """
+        Return the uploader the calling thread should use.
+
+        The HTTP transport behind a service object is not thread-safe, so
+        each thread is given its own copy of this uploader, created on
+        first use with a service from service_factory. Without a factory
+        this uploader itself is returned.
+
+        Args:
+            service_factory: Callable returning a new YouTube API service
+                object, e.g. Authenticator.build_service
+
+        Returns:
+            Uploader owned by the calling thread
+        """
+        if service_factory is None:
+            return self
+
+        uploader = getattr(self._thread_local, "uploader", None)
+        if uploader is None:
+            uploader = copy.copy(self)
+            uploader.youtube = service_factory()
+            self._thread_local.uploader = uploader
+        return uploader
+
+    def upload_videos(
+        self,
+        jobs: List[Tuple[str, VideoMetadata]],
+        max_parallel: int = 3,
+        service_factory: Optional[Callable[[], Any]] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+    ) -> List[Optional[str]]:
+        """
+        Upload several videos concurrently.
+
+        Resumable uploads are network-bound and release the GIL while
+        waiting on the socket, so a few worker threads scale throughput
+        almost linearly. The HTTP transport behind a service object is not
+        thread-safe, so each worker thread uploads through its own service
+        from service_factory; without a factory the videos are uploaded one
+        at a time on this uploader.
+
+        Args:
+            jobs: (video_path, metadata) pairs to upload
+            max_parallel: Maximum number of concurrent uploads
+            service_factory: Callable returning a new YouTube API service
+                object, e.g. Authenticator.build_service
+            rate_limiter: Optional rate limiter; a request token is taken
+                before each upload and quota is consumed for each success
+
+        Returns:
+            Video ID for each job (None if it failed), in the order of jobs
+        """
+        if not jobs:
+            return []
+
+        workers = max(1, min(max_parallel, len(jobs)))
+        if service_factory is None:
+            workers = 1
+        worker_factory = service_factory if workers > 1 else None
+
+        def upload(video_path: str, metadata: VideoMetadata) -> Optional[str]:
+            if rate_limiter is not None:
+                rate_limiter.wait_for_token()
+            # Concurrent Rich live displays conflict, so workers report quietly
+            video_id = self.for_current_thread(worker_factory).upload_video(
+                video_path,
+                metadata,
+                progress_callback=self.discard_progress if workers > 1 else None,
+            )
+            if video_id and rate_limiter is not None:
+                rate_limiter.consume_quota("video_upload", metadata.title)
+            return video_id
+
+        results: List[Optional[str]] = [None] * len(jobs)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="upload"
+        ) as executor:
+            futures = {
+                executor.submit(upload, video_path, metadata): index
+                for index, (video_path, metadata) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception:
+                    self.logger.error(
+                        "Upload failed: %s", jobs[index][0], exc_info=True
+                    )
+
+        return results
+
     def verify_upload(self, video_id: str) -> bool:
         """
         Verify that a video was uploaded successfully.
@@ -471,21 +794,21 @@ class VideoUploader:
             True if video exists and is accessible, False otherwise
         """
         try:
-            request = self.youtube.videos().list(part="status,snippet", id=video_id)
+            request = self.youtube.videos().list(part="status", id=video_id)
             response = request.execute()
 
-            if "items" in response and len(response["items"]) > 0:
-                video = response["items"][0]
-                status = video["status"]["uploadStatus"]
+            items = response.get("items")
+            if items:
+                status = items[0]["status"]["uploadStatus"]
 
-                self.logger.info(f"Video {video_id} status: {status}")
+                self.logger.info("Video %s status: %s", video_id, status)
                 return status in ["uploaded", "processed"]
             else:
-                self.logger.warning(f"Video {video_id} not found")
+                self.logger.warning("Video %s not found", video_id)
                 return False
 
         except HttpError as e:
-            self.logger.error(f"Failed to verify upload: {e}")
+            self.logger.error("Failed to verify upload: %s", e)
             return False
 
     def get_upload_status(self, video_id: str) -> Optional[Dict[str, Any]]:
@@ -504,21 +827,24 @@ class VideoUploader:
             )
             response = request.execute()
 
-            if "items" in response and len(response["items"]) > 0:
-                video = response["items"][0]
+            items = response.get("items")
+            if items:
+                video = items[0]
+                snippet = video["snippet"]
+                status = video["status"]
                 return {
                     "video_id": video_id,
-                    "title": video["snippet"]["title"],
-                    "upload_status": video["status"]["uploadStatus"],
-                    "privacy_status": video["status"]["privacyStatus"],
+                    "title": snippet["title"],
+                    "upload_status": status["uploadStatus"],
+                    "privacy_status": status["privacyStatus"],
                     "processing_status": video.get("processingDetails", {}).get(
                         "processingStatus"
                     ),
-                    "published_at": video["snippet"].get("publishedAt"),
+                    "published_at": snippet.get("publishedAt"),
                 }
 
             return None
 
         except HttpError as e:
-            self.logger.error(f"Failed to get upload status: {e}")
+            self.logger.error("Failed to get upload status: %s", e)
             return None
@@ -1,6 +1,13 @@
 """Utility modules"""
 
-from .logger import setup_logger
+from .bloom_filter import BloomFilter, PersistentBloomFilter
+from .logger import flush_logger, setup_logger
 from .rate_limiter import RateLimiter
 
-__all__ = ["setup_logger", "RateLimiter"]
+__all__ = [
+    "setup_logger",
+    "flush_logger",
+    "RateLimiter",
+    "BloomFilter",
+    "PersistentBloomFilter",
+]
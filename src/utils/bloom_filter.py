@@ -0,0 +1,149 @@
+"""
+Bloom filter for compact set-membership tests.
+
+Used to answer "definitely not present" queries without holding every
+key in memory. Positive answers may be false positives and must be
+confirmed against an authoritative source.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Tuple
+
+
+class _BloomFilterBase:
+    """
+    Hashing and bit operations shared by the Bloom filter classes.
+
+    Bit positions are derived from a single BLAKE2b digest using
+    double hashing, so each lookup costs one hash computation.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, bits):
+        """
+        Initialize the filter state.
+
+        Args:
+            num_bits: Number of bits in the filter
+            num_hashes: Number of bit positions per key
+            bits: Writable buffer of at least num_bits bits
+        """
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits
+
+    @staticmethod
+    def _digest(key: str) -> Tuple[int, int]:
+        """Return two 64-bit hash values for a key."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return (
+            int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little") | 1,
+        )
+
+    def _positions(self, key: str) -> Iterable[int]:
+        """Yield the bit positions for a key."""
+        h1, h2 = self._digest(key)
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, key: str):
+        """Add a key to the filter."""
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[str]):
+        """Add multiple keys to the filter."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class BloomFilter(_BloomFilterBase):
+    """Fixed-size Bloom filter backed by a bytearray."""
+
+    def __init__(self, capacity: int = 10_000, error_rate: float = 1e-4):
+        """
+        Initialize Bloom filter.
+
+        Args:
+            capacity: Expected number of elements
+            error_rate: Target false-positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        super().__init__(num_bits, num_hashes, bytearray((num_bits + 7) // 8))
+
+
+class PersistentBloomFilter(_BloomFilterBase):
+    """
+    Bloom filter whose bit array lives in a memory-mapped file.
+
+    The file starts with a small header recording a caller-defined stamp
+    (e.g. size and mtime of the data the filter was built from), so
+    callers can detect when the filter is stale and rebuild it.
+    """
+
+    MAGIC = b"YTUBLM01"
+    HEADER = struct.Struct("<8sQQ")  # magic, stamp size, stamp mtime_ns
+
+    def __init__(self, path: str, size_bytes: int = 256 * 1024, num_hashes: int = 7):
+        """
+        Open or create a persistent Bloom filter.
+
+        Args:
+            path: Path to the backing file
+            size_bytes: Size of the bit array in bytes
+            num_hashes: Number of bit positions per key
+        """
+        self.path = Path(path)
+
+        total_size = self.HEADER.size + size_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size != total_size:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, total_size)
+            self._mm = mmap.mmap(fd, total_size)
+        finally:
+            os.close(fd)
+
+        super().__init__(
+            size_bytes * 8, num_hashes, memoryview(self._mm)[self.HEADER.size :]
+        )
+        if self._mm[: len(self.MAGIC)] != self.MAGIC:
+            self.clear()
+
+    @property
+    def stamp(self) -> Tuple[int, int]:
+        """Stamp of the data the filter was last synchronized with."""
+        _, size, mtime_ns = self.HEADER.unpack_from(self._mm, 0)
+        return size, mtime_ns
+
+    @stamp.setter
+    def stamp(self, value: Tuple[int, int]):
+        self.HEADER.pack_into(self._mm, 0, self.MAGIC, *value)
+
+    def clear(self):
+        """Reset all bits and the stamp."""
+        self.bits[:] = bytes(len(self.bits))
+        self.stamp = (0, 0)
+
+    def close(self):
+        """Flush changes and unmap the backing file."""
+        self.bits.release()
+        self._mm.flush()
+        self._mm.close()
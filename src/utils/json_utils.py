@@ -0,0 +1,126 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths read and produce UTF-8 bytes.
+"""
+
+import functools
+import json
+import mmap
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active
+JSONDecodeError = json.JSONDecodeError
+
+# Files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Deserialize a JSON file.
+
+    Large files are memory-mapped and parsed straight from the page cache
+    rather than copied into an intermediate bytes object first.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed Python object
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return loads(view)
+            finally:
+                view.release()
+
+
+@functools.lru_cache(maxsize=None)
+def _api_model_class():
+    """Define the API client model lazily; googleapiclient is slow to import."""
+    from googleapiclient.model import JsonModel
+
+    class FastJsonModel(JsonModel):
+        """
+        JsonModel that parses responses with the active JSON backend.
+
+        Request bodies keep the stock serializer: they are small, and
+        googleapiclient relies on its ASCII-only output for batch requests.
+        """
+
+        def deserialize(self, content):
+            try:
+                body = loads(content)
+            except JSONDecodeError:
+                if isinstance(content, bytes):
+                    content = content.decode("utf-8")
+                return content
+
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+    return FastJsonModel
+
+
+def api_model(data_wrapper: bool = False):
+    """
+    Create a googleapiclient model that parses responses with orjson.
+
+    Args:
+        data_wrapper: Wrap requests and responses in a data wrapper
+
+    Returns:
+        googleapiclient.model.JsonModel instance
+    """
+    return _api_model_class()(data_wrapper=data_wrapper)
@@ -4,21 +4,132 @@ Logging configuration module for YouTube Uploader.
 Provides structured logging with file rotation and multiple log levels.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    SysLogHandler,
+    WatchedFileHandler,
+)
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+# Background listeners writing each configured logger's file handlers
+_listeners: Dict[str, QueueListener] = {}
 
-class NoTracebackFilter(logging.Filter):
-    """Filter that removes exception info from log records to prevent tracebacks on console."""
+# Records buffered per log file before they are written out
+LOG_BUFFER_CAPACITY = 256
 
-    def filter(self, record):
-        # Remove exception info so traceback text is not printed to console handlers.
-        record.exc_info = None
-        record.exc_text = None
-        return True
+# Where log records are written: rotating files, externally rotated files
+# (safe to share between processes), or the local syslog daemon
+LOG_BACKENDS = ("file", "watched", "syslog")
+
+
+class NoTracebackFormatter(logging.Formatter):
+    """Formatter that leaves exception and stack traces out of console output."""
+
+    def format(self, record):
+        # Format only the message line; the record itself is not modified, so
+        # file handlers sharing it still see the traceback.
+        record.message = record.getMessage()
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self.formatMessage(record)
+
+
+class SharedFormatter(logging.Formatter):
+    """
+    Formatter that formats each record only once.
+
+    The main, debug and error log files receive the same records with the
+    same layout; caching the text on the record lets every handler that
+    shares this formatter reuse it instead of formatting again.
+    """
+
+    def format(self, record):
+        cached = record.__dict__.get("_shared_format")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        text = super().format(record)
+        record._shared_format = (self, text)
+        return text
+
+
+class DetailedFormatter(SharedFormatter):
+    """
+    Formatter for the log files: ``[time] [LEVEL] [logger] message``.
+
+    Builds each line with an f-string instead of %-substitution and
+    reuses the formatted timestamp for all records within one second.
+    """
+
+    FORMAT = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
+    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self):
+        super().__init__(self.FORMAT, datefmt=self.DATE_FORMAT)
+        self._time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._time_cache = (second, text)
+        return text
+
+    def formatMessage(self, record):
+        return (
+            f"[{record.asctime}] [{record.levelname}] [{record.name}] {record.message}"
+        )
+
+
+def _syslog_address():
+    """Return the local syslog socket, falling back to UDP on localhost."""
+    for path in ("/dev/log", "/var/run/syslog"):
+        if os.path.exists(path):
+            return path
+    return ("localhost", 514)
+
+
+def _file_handler(
+    path: Path, backend: str, max_bytes: int, backup_count: int
+) -> logging.Handler:
+    """
+    Create the handler writing one log file for the given backend.
+
+    The file is opened by the first record written to it, so log files
+    that receive nothing during a run are never opened.
+    """
+    if backend == "watched":
+        return WatchedFileHandler(path, encoding="utf-8", delay=True)
+    return RotatingFileHandler(
+        path,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8",
+        delay=True,
+    )
+
+
+def _stop_listener(name: str, close_handlers: bool = False):
+    """Drain and stop the file listener for a logger, if one is running."""
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        target = handler.target
+        handler.flush()
+        if close_handlers:
+            handler.close()
+            target.close()
 
 
 def setup_logger(
@@ -28,10 +139,24 @@ def setup_logger(
     max_bytes: int = 50 * 1024 * 1024,  # 50MB
     backup_count: int = 5,
     console_output: bool = True,
+    backend: str = "file",
 ) -> logging.Logger:
     """
     Configure and return a logger with file rotation and console output.
 
+    File handlers sit behind a QueueHandler and are written by a
+    QueueListener thread, so logging calls on the upload path only
+    enqueue the record. The listener buffers records per file and writes
+    them in batches, when a buffer fills or an ERROR arrives. Everything
+    is flushed at interpreter exit; use flush_logger() to force pending
+    records out earlier.
+
+    The "file" backend rotates the log files itself, which is only safe
+    for a single process. With "watched" the files are reopened whenever
+    an external tool such as logrotate moves them, and with "syslog" all
+    records go to the local syslog daemon instead of files, so several
+    uploader processes can log at once.
+
     Args:
         name: Logger name
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -39,13 +164,18 @@ def setup_logger(
         max_bytes: Maximum size of each log file before rotation
         backup_count: Number of backup log files to keep
         console_output: Whether to output logs to console
+        backend: Log destination, one of LOG_BACKENDS
 
     Returns:
         Configured logger instance
     """
+    if backend not in LOG_BACKENDS:
+        raise ValueError(f"Unknown log backend: {backend}")
+
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
+    if backend != "syslog":
+        log_path.mkdir(parents=True, exist_ok=True)
 
     # Create logger
     logger = logging.getLogger(name)
@@ -53,57 +183,100 @@ def setup_logger(
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    _stop_listener(name, close_handlers=True)
 
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    # Records are handled here only, not again by any root handlers
+    logger.propagate = False
 
-    simple_formatter = logging.Formatter("[%(levelname)s] %(message)s")
+    # Create formatters; the file formatter is shared by all log files
+    detailed_formatter = DetailedFormatter()
 
-    # Main application log file (INFO and above)
-    main_log_file = log_path / f"{name}.log"
-    main_handler = RotatingFileHandler(
-        main_log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-    )
-    main_handler.setLevel(logging.INFO)
-    main_handler.setFormatter(detailed_formatter)
-    logger.addHandler(main_handler)
-
-    # Debug log file (all levels)
-    debug_log_file = log_path / f"{name}_debug.log"
-    debug_handler = RotatingFileHandler(
-        debug_log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-    )
-    debug_handler.setLevel(logging.DEBUG)
-    debug_handler.setFormatter(detailed_formatter)
-    logger.addHandler(debug_handler)
-
-    # Error log file (ERROR and CRITICAL only)
-    error_log_file = log_path / f"{name}_error.log"
-    error_handler = RotatingFileHandler(
-        error_log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
-    logger.addHandler(error_handler)
+    simple_formatter = NoTracebackFormatter("[%(levelname)s] %(message)s")
+
+    if backend == "syslog":
+        # One socket for all levels; syslog adds its own timestamp
+        syslog_handler = SysLogHandler(
+            address=_syslog_address(), facility=SysLogHandler.LOG_LOCAL0
+        )
+        syslog_handler.setLevel(logging.DEBUG)
+        syslog_handler.setFormatter(
+            logging.Formatter("%(name)s[%(process)d]: [%(levelname)s] %(message)s")
+        )
+        handlers = (syslog_handler,)
+    else:
+        # Main application log file (INFO and above)
+        main_log_file = log_path / f"{name}.log"
+        main_handler = _file_handler(main_log_file, backend, max_bytes, backup_count)
+        main_handler.setLevel(logging.INFO)
+        main_handler.setFormatter(detailed_formatter)
+
+        # Debug log file (all levels)
+        debug_log_file = log_path / f"{name}_debug.log"
+        debug_handler = _file_handler(debug_log_file, backend, max_bytes, backup_count)
+        debug_handler.setLevel(logging.DEBUG)
+        debug_handler.setFormatter(detailed_formatter)
+
+        # Error log file (ERROR and CRITICAL only)
+        error_log_file = log_path / f"{name}_error.log"
+        error_handler = _file_handler(error_log_file, backend, max_bytes, backup_count)
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(detailed_formatter)
+
+        handlers = (main_handler, debug_handler, error_handler)
+
+    # Batch writes to each file; the buffer's level decides what it accepts
+    buffered_handlers = []
+    for handler in handlers:
+        buffered = MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=handler
+        )
+        buffered.setLevel(handler.level)
+        buffered_handlers.append(buffered)
+
+    # File writes happen on a listener thread; callers only enqueue records
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *buffered_handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    atexit.register(_stop_listener, name)
+    logger.addHandler(QueueHandler(log_queue))
 
     # Console handler (no traceback text)
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper()))
+        # Tracebacks go to the file handlers only; the formatter omits them here
         console_handler.setFormatter(simple_formatter)
-        # Prevent full traceback text from being printed to console; tracebacks should go to file handlers only
-        console_handler.addFilter(NoTracebackFilter())
         logger.addHandler(console_handler)
 
-    logger.info(f"Logger initialized: {name}")
-    logger.debug(f"Log directory: {log_path.absolute()}")
+    logger.info("Logger initialized: %s", name)
+    if backend == "syslog":
+        logger.debug("Logging to syslog")
+    else:
+        logger.debug("Log directory: %s", log_path.absolute())
 
     return logger
 
 
+def flush_logger(name: str = "youtube_uploader"):
+    """
+    Write out all records queued for a logger's file handlers.
+
+    Args:
+        name: Logger name passed to setup_logger
+    """
+    listener = _listeners.get(name)
+    if listener is not None:
+        # Stopping the listener drains its queue; restart it afterwards
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+        listener.start()
+
+    for handler in logging.getLogger(name).handlers:
+        handler.flush()
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get an existing logger instance or create a default one.
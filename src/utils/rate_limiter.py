@@ -5,13 +5,20 @@ Tracks API quota usage and implements request throttling to prevent
 quota exhaustion.
 """
 
-import json
+import atexit
 import logging
+import os
+import threading
 import time
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Optional
 
+from . import json_utils
+
+_ONE_DAY = timedelta(days=1)
+
 
 class RateLimiter:
     """
@@ -31,6 +38,14 @@ class RateLimiter:
         "video_list": 1,
     }
 
+    # Persist quota state after this many operations or seconds,
+    # whichever comes first; flush() writes any remainder
+    FLUSH_EVERY_OPS = 16
+    FLUSH_INTERVAL = 30.0
+
+    # Only the most recent operations are kept in the quota file
+    MAX_OPERATION_HISTORY = 500
+
     def __init__(
         self,
         daily_quota: int = 10000,
@@ -57,23 +72,44 @@ class RateLimiter:
         self.tokens = max_requests_per_minute
         self.last_refill = time.time()
 
-        # Load quota tracking data
+        # Guards token bucket and quota state when used from upload workers
+        self._lock = threading.RLock()
+
+        # Load quota tracking data; the parsed reset time is kept alongside
+        self._reset_time: Optional[datetime] = None
         self.quota_data = self._load_quota_data()
 
+        # Quota changes are written in batches; see consume_quota
+        self._dirty = False
+        self._ops_since_flush = 0
+        self._last_flush = time.time()
+
+        # (epoch second, ISO timestamp) reused for operations in that second
+        self._timestamp_cache = (0, "")
+        try:
+            self.quota_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.error("Failed to create quota directory: %s", e)
+        atexit.register(self.flush)
+
     def _load_quota_data(self) -> Dict:
         """Load quota tracking data from file."""
-        if self.quota_file.exists():
-            try:
-                with open(self.quota_file, "r") as f:
-                    data = json.load(f)
-                    # Check if quota data is from today
-                    reset_time = datetime.fromisoformat(data.get("reset_time", ""))
-                    if reset_time.date() < datetime.now(timezone.utc).date():
-                        self.logger.info("Quota reset detected, starting fresh")
-                        return self._create_new_quota_data()
-                    return data
-            except Exception as e:
-                self.logger.warning(f"Failed to load quota data: {e}")
+        try:
+            data = json_utils.loads(self.quota_file.read_bytes())
+            # Check if quota data is from today
+            reset_time = datetime.fromisoformat(data.get("reset_time", ""))
+            if reset_time.date() < datetime.now(timezone.utc).date():
+                self.logger.info("Quota reset detected, starting fresh")
+                return self._create_new_quota_data()
+            data["operations"] = deque(
+                data.get("operations", ()), maxlen=self.MAX_OPERATION_HISTORY
+            )
+            self._reset_time = reset_time
+            return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("Failed to load quota data: %s", e)
 
         return self._create_new_quota_data()
 
@@ -86,26 +122,37 @@ class RateLimiter:
         )  # 00:00 PT = 08:00 UTC
         if now.hour >= 8:
             # Next day
-            from datetime import timedelta
-
-            reset_time += timedelta(days=1)
+            reset_time += _ONE_DAY
 
+        self._reset_time = reset_time
         return {
             "daily_quota": self.daily_quota,
             "used_quota": 0,
             "remaining_quota": self.daily_quota,
             "reset_time": reset_time.isoformat(),
-            "operations": [],
+            "operations": deque(maxlen=self.MAX_OPERATION_HISTORY),
         }
 
     def _save_quota_data(self):
         """Save quota tracking data to file."""
+        # Stays dirty if the write fails, so a later flush() retries it
+        self._ops_since_flush = 0
+        self._last_flush = time.time()
         try:
-            self.quota_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.quota_file, "w") as f:
-                json.dump(self.quota_data, f, indent=2)
+            data = dict(self.quota_data, operations=list(self.quota_data["operations"]))
+            tmp_file = self.quota_file.with_name(self.quota_file.name + ".tmp")
+            tmp_file.write_bytes(json_utils.dumps(data, indent=True))
+            os.replace(tmp_file, self.quota_file)
         except Exception as e:
-            self.logger.error(f"Failed to save quota data: {e}")
+            self.logger.error("Failed to save quota data: %s", e)
+        else:
+            self._dirty = False
+
+    def flush(self):
+        """Write pending quota changes to the quota file."""
+        with self._lock:
+            if self._dirty:
+                self._save_quota_data()
 
     def _refill_tokens(self):
         """Refill token bucket based on elapsed time."""
@@ -123,15 +170,40 @@ class RateLimiter:
 
         Implements token bucket algorithm for request throttling.
         """
-        self._refill_tokens()
+        self.acquire_batch(1)
 
-        while self.tokens < 1:
-            wait_time = (1 - self.tokens) * (60.0 / self.max_requests_per_minute)
-            self.logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
-            time.sleep(wait_time)
-            self._refill_tokens()
+    def acquire_batch(self, count: int) -> int:
+        """
+        Wait until ``count`` tokens are available and take them at once.
 
-        self.tokens -= 1
+        Lets callers that issue many requests pay the token bucket check
+        once per batch instead of once per request.
+
+        Args:
+            count: Number of tokens wanted (capped at the bucket size)
+
+        Returns:
+            Number of tokens acquired
+        """
+        count = max(1, min(count, self.max_requests_per_minute))
+
+        while True:
+            with self._lock:
+                self._refill_tokens()
+
+                if self.tokens >= count:
+                    self.tokens -= count
+                    return count
+
+                # The refill rate is fixed, so the shortfall sets the wait
+                wait_time = (count - self.tokens) * (
+                    60.0 / self.max_requests_per_minute
+                )
+
+            # Sleep without the lock so other threads can record quota;
+            # the tokens are re-checked since another waiter may take them
+            self.logger.debug("Rate limit reached, waiting %.2f seconds", wait_time)
+            time.sleep(wait_time)
 
     def check_quota(self, operation: str) -> bool:
         """
@@ -147,11 +219,13 @@ class RateLimiter:
         remaining = self.quota_data["remaining_quota"]
 
         if cost > remaining:
-            reset_time = datetime.fromisoformat(self.quota_data["reset_time"])
             self.logger.warning(
-                f"Insufficient quota for {operation}. "
-                f"Required: {cost}, Available: {remaining}. "
-                f"Quota resets at: {reset_time}"
+                "Insufficient quota for %s. Required: %s, Available: %s. "
+                "Quota resets at: %s",
+                operation,
+                cost,
+                remaining,
+                self._reset_time,
             )
             return False
 
@@ -161,29 +235,55 @@ class RateLimiter:
         """
         Consume quota for an operation and track it.
 
+        The quota file is rewritten every FLUSH_EVERY_OPS operations or
+        FLUSH_INTERVAL seconds rather than on every call; call flush() to
+        persist immediately. Pending changes are also flushed at exit.
+
         Args:
             operation: Operation type
             details: Additional details about the operation
         """
         cost = self.OPERATION_COSTS.get(operation, 0)
 
-        self.quota_data["used_quota"] += cost
-        self.quota_data["remaining_quota"] -= cost
-
-        operation_record = {
-            "type": operation,
-            "cost": cost,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "details": details,
-        }
-        self.quota_data["operations"].append(operation_record)
+        with self._lock:
+            quota = self.quota_data
+            quota["used_quota"] += cost
+            quota["remaining_quota"] -= cost
+
+            quota["operations"].append(
+                {
+                    "type": operation,
+                    "cost": cost,
+                    "timestamp": self._timestamp(),
+                    "details": details,
+                }
+            )
 
-        self.logger.info(
-            f"Quota consumed: {operation} ({cost} units). "
-            f"Remaining: {self.quota_data['remaining_quota']}/{self.daily_quota}"
-        )
+            self.logger.info(
+                "Quota consumed: %s (%s units). Remaining: %s/%s",
+                operation,
+                cost,
+                quota["remaining_quota"],
+                self.daily_quota,
+            )
 
-        self._save_quota_data()
+            self._dirty = True
+            self._ops_since_flush += 1
+            if (
+                self._ops_since_flush >= self.FLUSH_EVERY_OPS
+                or time.time() - self._last_flush >= self.FLUSH_INTERVAL
+            ):
+                self._save_quota_data()
+
+    def _timestamp(self) -> str:
+        """Return the current UTC time as ISO 8601, at one-second resolution."""
+        now = int(time.time())
+        if now != self._timestamp_cache[0]:
+            self._timestamp_cache = (
+                now,
+                datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            )
+        return self._timestamp_cache[1]
 
     def get_quota_status(self) -> Dict:
         """
@@ -223,8 +323,7 @@ class RateLimiter:
         Returns:
             True if all operations can be performed, False otherwise
         """
-        total_cost = sum(
-            self.OPERATION_COSTS.get(op, 0) * count for op, count in operations.items()
-        )
+        cost_of = self.OPERATION_COSTS.get
+        total_cost = sum([cost_of(op, 0) * count for op, count in operations.items()])
 
         return total_cost <= self.quota_data["remaining_quota"]
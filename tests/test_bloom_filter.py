@@ -0,0 +1,64 @@
+"""Tests for the in-memory and persistent Bloom filters."""
+
+from src.utils.bloom_filter import BloomFilter, PersistentBloomFilter
+
+KEYS = [f"video_{i:04d}.mp4" for i in range(2000)]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=len(KEYS))
+    bloom.update(KEYS)
+
+    assert all(key in bloom for key in KEYS)
+
+
+def test_bloom_filter_rejects_most_absent_keys():
+    bloom = BloomFilter(capacity=len(KEYS), error_rate=1e-3)
+    bloom.update(KEYS)
+
+    absent = [f"other_{i}.mp4" for i in range(2000)]
+    false_positives = sum(key in bloom for key in absent)
+    assert false_positives < 20
+
+
+def test_persistent_filter_keeps_keys_and_stamp_across_reopen(tmp_path):
+    path = tmp_path / "history.bloom"
+    bloom = PersistentBloomFilter(str(path))
+    bloom.update(KEYS)
+    bloom.stamp = (1234, 5678)
+    bloom.close()
+
+    reopened = PersistentBloomFilter(str(path))
+    try:
+        assert reopened.stamp == (1234, 5678)
+        assert all(key in reopened for key in KEYS)
+    finally:
+        reopened.close()
+
+
+def test_persistent_filter_starts_empty_when_size_changes(tmp_path):
+    path = tmp_path / "history.bloom"
+    bloom = PersistentBloomFilter(str(path), size_bytes=1024)
+    bloom.add("video.mp4")
+    bloom.stamp = (1, 2)
+    bloom.close()
+
+    resized = PersistentBloomFilter(str(path), size_bytes=2048)
+    try:
+        assert resized.stamp == (0, 0)
+        assert "video.mp4" not in resized
+    finally:
+        resized.close()
+
+
+def test_clear_resets_bits_and_stamp(tmp_path):
+    bloom = PersistentBloomFilter(str(tmp_path / "history.bloom"))
+    try:
+        bloom.add("video.mp4")
+        bloom.stamp = (3, 4)
+        bloom.clear()
+
+        assert bloom.stamp == (0, 0)
+        assert "video.mp4" not in bloom
+    finally:
+        bloom.close()
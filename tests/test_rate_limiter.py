@@ -0,0 +1,79 @@
+"""Tests for quota tracking and persistence in RateLimiter."""
+
+import json
+
+import pytest
+
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def quota_file(tmp_path):
+    return tmp_path / "quota.json"
+
+
+def read_quota(quota_file):
+    return json.loads(quota_file.read_text())
+
+
+def test_consume_quota_is_written_in_batches(quota_file):
+    limiter = RateLimiter(quota_file=str(quota_file))
+
+    for _ in range(RateLimiter.FLUSH_EVERY_OPS - 1):
+        limiter.consume_quota("video_list")
+    assert not quota_file.exists()
+
+    limiter.consume_quota("video_list")
+    assert read_quota(quota_file)["used_quota"] == RateLimiter.FLUSH_EVERY_OPS
+
+
+def test_flush_writes_pending_usage_atomically(quota_file):
+    limiter = RateLimiter(daily_quota=10000, quota_file=str(quota_file))
+    limiter.consume_quota("video_upload", "First video")
+    limiter.flush()
+
+    data = read_quota(quota_file)
+    assert data["used_quota"] == 1600
+    assert data["remaining_quota"] == 8400
+    assert data["operations"][0]["details"] == "First video"
+    assert list(quota_file.parent.iterdir()) == [quota_file]
+
+
+def test_usage_survives_reload(quota_file):
+    limiter = RateLimiter(quota_file=str(quota_file))
+    limiter.consume_quota("playlist_insert")
+    limiter.flush()
+
+    reloaded = RateLimiter(quota_file=str(quota_file))
+    assert reloaded.get_quota_status()["used"] == 50
+
+
+def test_failed_write_keeps_changes_dirty(quota_file, monkeypatch):
+    limiter = RateLimiter(quota_file=str(quota_file))
+    limiter.consume_quota("video_upload")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(rate_limiter_module.os, "replace", fail_replace)
+        limiter.flush()
+    assert not quota_file.exists()
+
+    limiter.flush()
+    assert read_quota(quota_file)["used_quota"] == 1600
+
+
+def test_corrupt_quota_file_starts_fresh(quota_file):
+    quota_file.write_text("{not json")
+
+    limiter = RateLimiter(daily_quota=500, quota_file=str(quota_file))
+    assert limiter.get_quota_status()["remaining"] == 500
+
+
+def test_can_perform_operations_sums_costs(quota_file):
+    limiter = RateLimiter(daily_quota=3300, quota_file=str(quota_file))
+
+    assert limiter.can_perform_operations({"video_upload": 2, "playlist_insert": 2})
+    assert not limiter.can_perform_operations({"video_upload": 2, "playlist_insert": 3})
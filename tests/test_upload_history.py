@@ -0,0 +1,121 @@
+"""Tests for the upload history journal and its Bloom filter index."""
+
+import json
+
+from main import UploadHistory
+
+
+def write_legacy_history(history_file, filenames):
+    history = {
+        "uploads": [
+            {
+                "filename": name,
+                "video_id": f"id_{i}",
+                "title": name,
+                "uploaded_at": "2024-01-15T10:30:00+00:00",
+                "playlist_id": None,
+                "status": "completed",
+            }
+            for i, name in enumerate(filenames)
+        ],
+        "last_updated": "2024-01-15T10:30:00+00:00",
+    }
+    history_file.write_text(json.dumps(history))
+
+
+def read_journal(history):
+    return [json.loads(line) for line in history.journal_file.read_text().splitlines()]
+
+
+def test_legacy_json_history_is_migrated_to_journal(tmp_path):
+    history_file = tmp_path / "upload_history.json"
+    write_legacy_history(history_file, ["a.mp4", "b.mp4"])
+
+    history = UploadHistory(str(history_file))
+    try:
+        assert [r["filename"] for r in read_journal(history)] == ["a.mp4", "b.mp4"]
+        assert history.is_uploaded("a.mp4")
+        assert history.is_uploaded("b.mp4")
+        assert not history.is_uploaded("c.mp4")
+        assert history.get_uploaded_count() == 2
+    finally:
+        history.close()
+
+
+def test_uploads_are_found_after_reopen(tmp_path):
+    history_file = tmp_path / "upload_history.json"
+    names = [f"video_{i:03d}.mp4" for i in range(200)]
+
+    history = UploadHistory(str(history_file))
+    for i, name in enumerate(names):
+        history.add_upload(name, f"id_{i}", name)
+    history.close()
+
+    reopened = UploadHistory(str(history_file))
+    try:
+        assert all(reopened.is_uploaded(name) for name in names)
+        assert not reopened.is_uploaded("missing.mp4")
+    finally:
+        reopened.close()
+
+
+def test_index_is_rebuilt_when_journal_changes_externally(tmp_path):
+    history_file = tmp_path / "upload_history.json"
+    history = UploadHistory(str(history_file))
+    history.add_upload("a.mp4", "id_a", "A")
+    history.close()
+
+    record = {"filename": "b.mp4", "video_id": "id_b", "status": "completed"}
+    with open(history.journal_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+    reopened = UploadHistory(str(history_file))
+    try:
+        assert reopened.is_uploaded("a.mp4")
+        assert reopened.is_uploaded("b.mp4")
+    finally:
+        reopened.close()
+
+
+def test_failed_uploads_are_not_marked_uploaded(tmp_path):
+    history = UploadHistory(str(tmp_path / "upload_history.json"))
+    try:
+        history.add_upload("a.mp4", "id_a", "A", status="failed")
+        assert not history.is_uploaded("a.mp4")
+    finally:
+        history.close()
+
+
+def test_torn_final_line_is_skipped(tmp_path):
+    history_file = tmp_path / "upload_history.json"
+    history = UploadHistory(str(history_file))
+    history.add_upload("a.mp4", "id_a", "A")
+    history.close()
+    with open(history.journal_file, "a") as f:
+        f.write('{"filename": "b.mp4", "vid')
+
+    reopened = UploadHistory(str(history_file))
+    try:
+        assert reopened.is_uploaded("a.mp4")
+        assert not reopened.is_uploaded("b.mp4")
+    finally:
+        reopened.close()
+
+
+def test_playlist_insert_stays_owed_until_recorded(tmp_path):
+    history_file = tmp_path / "upload_history.json"
+    history = UploadHistory(str(history_file))
+    history.add_upload("a.mp4", "id_a", "A", playlist="Tutorials")
+    history.add_upload("b.mp4", "id_b", "B", playlist="Tutorials")
+    history.add_upload("c.mp4", "id_c", "C", playlist="Gone")
+    history.add_playlist_item("b.mp4", "id_b", "PL1")
+    history.add_playlist_item("c.mp4", "id_c", None, status="playlist_abandoned")
+    history.close()
+
+    reopened = UploadHistory(str(history_file))
+    try:
+        assert reopened.get_pending_playlist("a.mp4") == ("id_a", "Tutorials")
+        assert reopened.get_pending_playlist("b.mp4") is None
+        assert reopened.get_pending_playlist("c.mp4") is None
+    finally:
+        reopened.close()
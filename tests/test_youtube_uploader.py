@@ -0,0 +1,78 @@
+"""Tests for YouTubeUploader batch planning."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from main import YouTubeUploader
+
+UPLOAD_COST = 1600
+PLAYLIST_COST = 50
+
+
+class FakeRateLimiter:
+    COSTS = {"video_upload": UPLOAD_COST, "playlist_insert": PLAYLIST_COST}
+
+    def __init__(self, remaining):
+        self.remaining = remaining
+
+    def estimate_operation_cost(self, operation):
+        return self.COSTS[operation]
+
+    def get_quota_status(self):
+        return {"remaining": self.remaining}
+
+
+def make_uploader(remaining):
+    uploader = YouTubeUploader()
+    uploader.rate_limiter = FakeRateLimiter(remaining)
+    return uploader
+
+
+def videos(*playlists):
+    return [SimpleNamespace(playlist=playlist) for playlist in playlists]
+
+
+@pytest.mark.parametrize(
+    "remaining, expected",
+    [
+        (0, 0),
+        (UPLOAD_COST - 1, 0),
+        (UPLOAD_COST + PLAYLIST_COST, 1),
+        (2 * UPLOAD_COST + PLAYLIST_COST, 2),
+        (3 * UPLOAD_COST + PLAYLIST_COST - 1, 2),
+        (3 * UPLOAD_COST + 2 * PLAYLIST_COST, 3),
+    ],
+)
+def test_fit_to_quota_keeps_longest_affordable_prefix(remaining, expected):
+    uploader = make_uploader(remaining)
+
+    fits, owed = uploader._fit_to_quota(videos("PL", None, "PL"), 0)
+    assert (fits, owed) == (expected, 0)
+
+
+def test_fit_to_quota_stops_at_first_video_that_does_not_fit():
+    # The third video would fit on its own, but uploads keep order
+    uploader = make_uploader(UPLOAD_COST + PLAYLIST_COST + UPLOAD_COST - 1)
+
+    fits, _ = uploader._fit_to_quota(videos("PL", None, None), 0)
+    assert fits == 1
+
+
+def test_fit_to_quota_serves_owed_inserts_first():
+    uploader = make_uploader(UPLOAD_COST + 3 * PLAYLIST_COST)
+
+    assert uploader._fit_to_quota(videos(None), 3) == (1, 3)
+    assert uploader._fit_to_quota(videos(None), 4) == (0, 4)
+
+
+def test_fit_to_quota_caps_owed_inserts_to_budget():
+    uploader = make_uploader(2 * PLAYLIST_COST + 10)
+
+    assert uploader._fit_to_quota(videos(None), 5) == (0, 2)
+
+
+def test_fit_to_quota_with_exhausted_quota():
+    uploader = make_uploader(-100)
+
+    assert uploader._fit_to_quota(videos("PL"), 2) == (0, 0)